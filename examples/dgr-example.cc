@@ -83,6 +83,7 @@ main(int argc, char* argv[])
     NodeContainer* nc = new NodeContainer[totlinks];
     NetDeviceContainer* ndc = new NetDeviceContainer[totlinks];
     PointToPointHelper p2p;
+    p2p.SetDeviceAttribute("DataRate", StringValue("100Mbps")); // the same on every link
     TrafficControlHelper tch;
     tch.SetRootQueueDisc("ns3::DGRQueueDisc");
 
@@ -94,13 +95,8 @@ main(int argc, char* argv[])
     for (iter = inFile->LinksBegin(); iter != inFile->LinksEnd(); iter++, i++)
     {
         nc[i] = NodeContainer(iter->GetFromNode(), iter->GetToNode());
-        std::string delay = iter->GetAttribute("Weight");
-        std::stringstream ss;
-        ss << delay;
-        uint16_t metric; //!< metric in milliseconds
-        ss >> metric;
+        std::string delay = iter->GetAttribute("Weight"); // in milliseconds
         p2p.SetChannelAttribute("Delay", StringValue(delay + "ms"));
-        p2p.SetDeviceAttribute("DataRate", StringValue("100Mbps"));
         ndc[i] = p2p.Install(nc[i]);
         tch.Install(ndc[i]);
         ipic[i] = address.Assign(ndc[i]);
@@ -138,19 +134,14 @@ main(int argc, char* argv[])
     // --------------- Net Anim ---------------------
     AnimationInterface anim(topo + expName + ".xml");
     std::ifstream topoNetanim(input);
-    std::istringstream buffer;
     std::string line;
-    getline(topoNetanim, line);
+    getline(topoNetanim, line); // skip the "<nodes> <links>" header
+    // each node line is "<no> <x> <y>", read the fields straight from the file
     for (uint32_t i = 0; i < nodes.GetN(); i++)
     {
-        getline(topoNetanim, line);
-        buffer.clear();
-        buffer.str(line);
         int no;
         double x, y;
-        buffer >> no;
-        buffer >> x;
-        buffer >> y;
+        topoNetanim >> no >> x >> y;
         anim.SetConstantPosition(nodes.Get(no), x * 10, y * 10);
     }
 
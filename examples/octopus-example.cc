@@ -82,6 +82,7 @@ main(int argc, char* argv[])
     NodeContainer* nc = new NodeContainer[totlinks];
     NetDeviceContainer* ndc = new NetDeviceContainer[totlinks];
     PointToPointHelper p2p;
+    p2p.SetDeviceAttribute("DataRate", StringValue("100Mbps")); // the same on every link
     TrafficControlHelper tch;
     tch.SetRootQueueDisc("ns3::DDRQueueDisc");
 
@@ -93,13 +94,8 @@ main(int argc, char* argv[])
     for (iter = inFile->LinksBegin(); iter != inFile->LinksEnd(); iter++, i++)
     {
         nc[i] = NodeContainer(iter->GetFromNode(), iter->GetToNode());
-        std::string delay = iter->GetAttribute("Weight");
-        std::stringstream ss;
-        ss << delay;
-        uint16_t metric; //!< metric in milliseconds
-        ss >> metric;
+        std::string delay = iter->GetAttribute("Weight"); // in milliseconds
         p2p.SetChannelAttribute("Delay", StringValue(delay + "ms"));
-        p2p.SetDeviceAttribute("DataRate", StringValue("100Mbps"));
         ndc[i] = p2p.Install(nc[i]);
         tch.Install(ndc[i]);
         ipic[i] = address.Assign(ndc[i]);
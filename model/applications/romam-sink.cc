@@ -204,6 +204,8 @@ RomamSink::StopApplication() // Called at time specified by Stop
         m_socket->Close();
         m_socket->SetRecvCallback(MakeNullCallback<void, Ptr<Socket>>());
     }
+    // Delay records are written without a per-line flush, push them out once here
+    m_delayStream->GetStream()->flush();
 }
 
 int i = 0; // count packets
@@ -215,6 +217,8 @@ RomamSink::HandleRead(Ptr<Socket> socket)
     Ptr<Packet> packet;
     Address from;
     Address localAddress;
+    // The local address is the same for every packet drained from this socket
+    socket->GetSockName(localAddress);
 
     while ((packet = socket->RecvFrom(from)))
     {
@@ -248,8 +252,9 @@ RomamSink::HandleRead(Ptr<Socket> socket)
             //     *os << "0" << std::endl;
             // }
 
-            *os << timeTag.GetTimestamp().GetMicroSeconds() / 1000.0 << "    "
-                << GetDelay(packet).GetMicroSeconds() / 1000.0 << std::endl;
+            Time txTime = timeTag.GetTimestamp();
+            *os << txTime.GetMicroSeconds() / 1000.0 << "    "
+                << (Simulator::Now() - txTime).GetMicroSeconds() / 1000.0 << '\n';
         }
         // get delay
         m_totalRx += packet->GetSize();
@@ -269,7 +274,6 @@ RomamSink::HandleRead(Ptr<Socket> socket)
                                    << Inet6SocketAddress::ConvertFrom(from).GetPort()
                                    << " total Rx " << m_totalRx << " bytes");
         }
-        socket->GetSockName(localAddress);
         m_rxTrace(packet, from);
         m_rxTraceWithAddresses(packet, from, localAddress);
 
@@ -232,6 +232,15 @@ RomamTcpApplication::SendData(const Address& from, const Address& to)
 {
     NS_LOG_FUNCTION(this);
 
+    // Simulation time does not advance while this loop fills the send
+    // buffer, so every new packet in this call carries the same tags
+    TimestampTag txTimeTag;
+    FlagTag flagTag;
+    BudgetTag budgetTag;
+    txTimeTag.SetTimestamp(Simulator::Now());
+    flagTag.SetFlag(m_flag);
+    budgetTag.SetBudget(m_budget);
+
     while (m_maxBytes == 0 || m_totBytes < m_maxBytes)
     { // Time to send more
 
@@ -248,13 +257,6 @@ RomamTcpApplication::SendData(const Address& from, const Address& to)
         NS_LOG_LOGIC("sending packet at " << Simulator::Now());
         Ptr<Packet> packet;
 
-        TimestampTag txTimeTag;
-        FlagTag flagTag;
-        BudgetTag budgetTag;
-        txTimeTag.SetTimestamp(Simulator::Now());
-        flagTag.SetFlag(m_flag);
-        // flagTag.Print (std::cout);
-
         if (m_unsentPacket)
         {
             packet = m_unsentPacket;
@@ -267,7 +269,6 @@ RomamTcpApplication::SendData(const Address& from, const Address& to)
             packet->AddPacketTag(flagTag);
             if (m_budget != MAX_UINT_32)
             {
-                budgetTag.SetBudget(m_budget);
                 packet->AddPacketTag(budgetTag);
             }
         }
@@ -35,7 +35,9 @@ RomamUdpApplication::RomamUdpApplication()
       m_budget(MAX_UINT_32),
       m_flag(false),
       m_vbr(false),
-      m_priority(false)
+      m_priority(false),
+      m_vbrRate(CreateObject<UniformRandomVariable>()),
+      m_txSeconds(0)
 {
 }
 
@@ -76,6 +78,7 @@ RomamUdpApplication::Setup(Ptr<Socket> socket,
     m_dataRate = dataRate;
     m_budget = budget;
     m_flag = flag;
+    UpdateTxInterval();
 }
 
 void
@@ -92,6 +95,7 @@ RomamUdpApplication::Setup(Ptr<Socket> socket,
     m_nPackets = nPackets;
     m_dataRate = dataRate;
     m_flag = flag;
+    UpdateTxInterval();
 }
 
 void
@@ -163,15 +167,13 @@ RomamUdpApplication::ScheduleTx()
     {
         if (m_vbr)
         {
-            Ptr<UniformRandomVariable> rand = CreateObject<UniformRandomVariable>();
-            double rate = static_cast<double>(rand->GetInteger(1, 100)) / 100;
-            Time tNext(
-                Seconds(rate * m_packetSize * 8 / static_cast<double>(m_dataRate.GetBitRate())));
+            double rate = static_cast<double>(m_vbrRate->GetInteger(1, 100)) / 100;
+            Time tNext(Seconds(rate * m_txSeconds));
             m_sendEvent = Simulator::Schedule(tNext, &RomamUdpApplication::SendPacket, this);
         }
         else
         {
-            Time tNext(Seconds(m_packetSize * 8 / static_cast<double>(m_dataRate.GetBitRate())));
+            Time tNext(Seconds(m_txSeconds));
             m_sendEvent = Simulator::Schedule(tNext, &RomamUdpApplication::SendPacket, this);
         }
     }
@@ -181,6 +183,13 @@ void
 RomamUdpApplication::ChangeRate(DataRate newDataRate)
 {
     m_dataRate = newDataRate;
+    UpdateTxInterval();
+}
+
+void
+RomamUdpApplication::UpdateTxInterval()
+{
+    m_txSeconds = m_packetSize * 8 / static_cast<double>(m_dataRate.GetBitRate());
 }
 
 } // namespace ns3
\ No newline at end of file
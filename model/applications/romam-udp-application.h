@@ -79,6 +79,8 @@ class RomamUdpApplication : public Application
     void ScheduleTx();
     /// Send a packet
     void SendPacket();
+    /// Recompute the packet transmission time after a size or rate change
+    void UpdateTxInterval();
 
     Ptr<Socket> m_socket;  //!< The transmission socket
     Address m_peer;        //!< The destination address
@@ -92,6 +94,9 @@ class RomamUdpApplication : public Application
     bool m_flag;           //!< The packet flag
     bool m_vbr;            //!< true meanse VBR
     bool m_priority;       //!< priority
+
+    Ptr<UniformRandomVariable> m_vbrRate; //!< VBR interval scaling, reused across sends
+    double m_txSeconds;                   //!< Time to send one packet at m_dataRate, in seconds
 };
 
 } // namespace ns3
@@ -7,6 +7,9 @@
 namespace ns3
 {
 
+/// Serialized size of one NSE: interface ID and state, 4 bytes each
+static const uint32_t NSE_SERIALIZED_SIZE = 4 + 4;
+
 //----------------------------------------------------------------------
 //-- DgrNse
 //------------------------------------------------------
@@ -39,7 +42,7 @@ DgrNse::Print(std::ostream& os) const
 uint32_t
 DgrNse::GetSerializedSize() const
 {
-    return 4 + 4;
+    return NSE_SERIALIZED_SIZE;
 }
 
 void
@@ -129,8 +132,7 @@ DgrHeader::Print(std::ostream& os) const
 uint32_t
 DgrHeader::GetSerializedSize() const
 {
-    DgrNse nse;
-    return 4 + m_nseList.size() * nse.GetSerializedSize();
+    return 4 + m_nseList.size() * NSE_SERIALIZED_SIZE;
 }
 
 void
@@ -145,7 +147,7 @@ DgrHeader::Serialize(Buffer::Iterator start) const
          iter++)
     {
         iter->Serialize(i);
-        i.Next(iter->GetSerializedSize());
+        i.Next(NSE_SERIALIZED_SIZE);
     }
 }
 
@@ -178,9 +180,8 @@ DgrHeader::Deserialize(Buffer::Iterator start)
     }
 
     DgrNse nse;
-    uint32_t nseSize = nse.GetSerializedSize();
-    uint8_t nseNumber =
-        i.GetRemainingSize() / nseSize; // !!!!!!!!!!!!! the size should be the same with nse.
+    uint8_t nseNumber = i.GetRemainingSize() /
+                        NSE_SERIALIZED_SIZE; // !!!!!!!!!!!!! the size should be the same with nse.
     for (uint8_t n = 0; n < nseNumber; n++)
     {
         i.Next(nse.Deserialize(i));
@@ -220,7 +221,7 @@ DgrHeader::GetNseNumber() const
     return m_nseList.size();
 }
 
-std::list<DgrNse>
+const std::list<DgrNse>&
 DgrHeader::GetNseList() const
 {
     return m_nseList;
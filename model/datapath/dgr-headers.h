@@ -174,7 +174,7 @@ class DgrHeader : public Header
      * \brief Get the list of NSEs included in the message
      * \returns the list of DNEs in the message
      */
-    std::list<DgrNse> GetNseList() const;
+    const std::list<DgrNse>& GetNseList() const;
 
   private:
     uint8_t m_command;           //!< command type
@@ -26,8 +26,8 @@ NS_LOG_COMPONENT_DEFINE ("LinkStateAdvertisment");
 
 LinkRecord::LinkRecord ()
   :
-    m_linkId ("0.0.0.0"),
-    m_linkData ("0.0.0.0"),
+    m_linkId (Ipv4Address::GetZero ()),
+    m_linkData (Ipv4Address::GetZero ()),
     m_linkType (Unknown),
     m_metric (0)
 {
@@ -119,10 +119,10 @@ LinkRecord::SetMetric (uint16_t metric)
 LSA::LSA()
   : 
     m_lsType (LSA::Unknown),
-    m_linkStateId ("0.0.0.0"),
-    m_advertisingRtr ("0.0.0.0"),
+    m_linkStateId (Ipv4Address::GetZero ()),
+    m_advertisingRtr (Ipv4Address::GetZero ()),
     m_linkRecords (),
-    m_networkLSANetworkMask ("0.0.0.0"),
+    m_networkLSANetworkMask (Ipv4Mask::GetZero ()),
     m_attachedRouters (),
     m_status (LSA::LSA_SPF_NOT_EXPLORED),
     m_node_id (0)
@@ -139,7 +139,7 @@ LSA::LSA (
     m_linkStateId (linkStateId),
     m_advertisingRtr (advertisingRtr),
     m_linkRecords (),
-    m_networkLSANetworkMask ("0.0.0.0"),
+    m_networkLSANetworkMask (Ipv4Mask::GetZero ()),
     m_attachedRouters (),
     m_status (status),
     m_node_id (0)
@@ -244,15 +244,9 @@ LinkRecord *
 LSA::GetLinkRecord (uint32_t n) const
 {
   NS_LOG_FUNCTION (this << n);
-  uint32_t j = 0;
-  for ( ListOfLinkRecords_t::const_iterator i = m_linkRecords.begin ();
-        i != m_linkRecords.end (); 
-        i++, j++)
+  if (n < m_linkRecords.size ())
     {
-      if (j == n) 
-        {
-          return *i;
-        }
+      return m_linkRecords[n];
     }
   NS_ASSERT_MSG (false, "LSA::GetLinkRecord (): invalid index");
   return 0;
@@ -358,7 +352,7 @@ LSA::GetAttachedRouter (uint32_t n) const
         }
     }
   NS_ASSERT_MSG (false, "LSA::GetAttachedRouter (): invalid index");
-  return Ipv4Address ("0.0.0.0");
+  return Ipv4Address::GetZero ();
 }
 
 void
@@ -5,6 +5,7 @@
 
 #include <stdint.h>
 #include <list>
+#include <vector>
 #include "ns3/object.h"
 #include "ns3/ptr.h"
 #include "ns3/node.h"
@@ -500,15 +501,16 @@ private:
 /**
  * A convenience typedef to avoid too much writers cramp.
  */
-  typedef std::list<LinkRecord*> ListOfLinkRecords_t;
+  typedef std::vector<LinkRecord*> ListOfLinkRecords_t;
 
 /**
  * Each Link State Advertisement contains a number of Link Records that
  * describe the kinds of links that are attached to a given node.  We 
  * consider PointToPoint and StubNetwork links.
  *
- * m_linkRecords is an STL list container to hold the Link Records that have
- * been discovered and prepared for the advertisement.
+ * m_linkRecords is an STL vector container to hold the Link Records that have
+ * been discovered and prepared for the advertisement.  The SPF calculations
+ * walk them by index through GetLinkRecord (), so they are kept contiguous.
  *
  * @see GlobalRouting::DiscoverLSAs ()
  */
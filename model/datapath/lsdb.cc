@@ -64,11 +64,11 @@ operator<< (std::ostream& os, const Vertex::ListOfVertex_t& vs)
 
 Vertex::Vertex () : 
   m_vertexType (VertexUnknown), 
-  m_vertexId ("255.255.255.255"), 
+  m_vertexId (Ipv4Address::GetBroadcast ()), 
   m_lsa (0),
   m_distanceFromRoot (DISTINFINITY), 
   m_rootOif (DISTINFINITY),
-  m_nextHop ("0.0.0.0"),
+  m_nextHop (Ipv4Address::GetZero ()),
   m_parents (),
   m_children (),
   m_vertexProcessed (false)
@@ -81,7 +81,7 @@ Vertex::Vertex (LSA* lsa) :
   m_lsa (lsa),
   m_distanceFromRoot (DISTINFINITY), 
   m_rootOif (DISTINFINITY),
-  m_nextHop ("0.0.0.0"),
+  m_nextHop (Ipv4Address::GetZero ()),
   m_parents (),
   m_children (),
   m_vertexProcessed (false)
@@ -256,11 +256,10 @@ Vertex::MergeRootExitDirections (const Vertex* vertex)
 
   // obtain the external list of exit directions
   //
-  // Append the external list into 'this' and remove duplication afterward
-  const ListOfNodeExit_t& extList = vertex->m_ecmpRootExits;
-  m_ecmpRootExits.insert (m_ecmpRootExits.end (), 
-                          extList.begin (), extList.end ());
-  m_ecmpRootExits.sort ();
+  // Both lists are kept sorted, so merge them in a single linear pass
+  // and remove duplication afterward
+  ListOfNodeExit_t extList = vertex->m_ecmpRootExits;
+  m_ecmpRootExits.merge (extList);
   m_ecmpRootExits.unique ();
 }
 
@@ -322,11 +321,10 @@ Vertex::MergeParent (const Vertex* v)
   NS_LOG_FUNCTION (this << v);
 
   NS_LOG_LOGIC ("Before merge, list of parents = " << m_parents);
-  // combine the two lists first, and then remove any duplicated after
-  m_parents.insert (m_parents.end (), 
-                    v->m_parents.begin (), v->m_parents.end ());
+  // both lists are kept sorted, so merge them in a single linear pass
+  ListOfVertex_t parents = v->m_parents;
+  m_parents.merge (parents);
   // remove duplication
-  m_parents.sort ();
   m_parents.unique ();
   NS_LOG_LOGIC ("After merge, list of parents = " << m_parents);
 }
@@ -480,15 +478,13 @@ LSDB::GetLSA (Ipv4Address addr) const
 {
   NS_LOG_FUNCTION (this << addr);
 //
-// Look up an LSA by its address.
+// Look up an LSA by its address.  The database is keyed by address, so let
+// the map find it instead of comparing against every entry.
 //
-  LSDBMap_t::const_iterator i;
-  for (i= m_database.begin (); i!= m_database.end (); i++)
+  LSDBMap_t::const_iterator i = m_database.find (addr);
+  if (i != m_database.end ())
     {
-      if (i->first == addr)
-        {
-          return i->second;
-        }
+      return i->second;
     }
   return 0;
 }
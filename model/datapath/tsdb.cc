@@ -9,6 +9,8 @@ namespace ns3 {
 
 StatusUnit::StatusUnit ()
   : m_matrix {{0}},
+    m_rowCount {0},
+    m_rowWeight {0},
     m_state (0)
 {
 }
@@ -38,13 +40,15 @@ StatusUnit::GetEstimateDelayDDR () const
 {
   // std::cout << "current delay: " << GetEstimateDelayDGR () << std::endl;
   // Print (std::cout);
-  uint32_t ret = 0;
-  int counter = 0;
-  for (int i = 0; i < STATESIZE; i ++)
+  // The row totals are kept up to date by Update (), so the expected next
+  // state does not need a scan of the matrix on every route lookup.
+  int counter = m_rowCount[m_state];
+  if (counter == 0)
     {
-      ret += m_matrix[m_state][i]* (i);
-      counter += m_matrix[m_state][i];
+      // No transition observed out of this state yet
+      return GetEstimateDelayDGR ();
     }
+  uint32_t ret = m_rowWeight[m_state];
   return ret*2000/counter;
 }
 uint32_t
@@ -79,6 +83,8 @@ void
 StatusUnit::Update (int state)
 {
   m_matrix[m_state][state] ++;
+  m_rowCount[m_state] ++;
+  m_rowWeight[m_state] += state;
   m_state = state;
 }
 
@@ -105,7 +111,8 @@ StatusUnit::Print (std::ostream &os) const
 //-- NeighborStatusEntry
 //------------------------------------------------------
 NeighborStatusEntry::NeighborStatusEntry ()
-    : m_database ()
+    : m_database (),
+      m_size (0)
 {
 }
 
@@ -117,15 +124,15 @@ NeighborStatusEntry::~NeighborStatusEntry ()
 void
 NeighborStatusEntry::Insert (uint32_t n_iface, StatusUnit* su)
 {
-  NSMap_t::iterator it = m_database.find (n_iface);
-  if (it != m_database.end ())
+  if (n_iface >= m_database.size ())
     {
-      it->second = su;
+      m_database.resize (n_iface + 1, nullptr);
     }
-  else
+  if (m_database[n_iface] == nullptr)
     {
-      m_database.insert (NSPair_t (n_iface, su));
+      m_size ++;
     }
+  m_database[n_iface] = su;
 }
 
 StatusUnit*
@@ -135,10 +142,9 @@ NeighborStatusEntry::GetStatusUnit (uint32_t n_iface) const
   //
   // Look up a SU by it's interface.
   //
-  NSMap_t::const_iterator ci = m_database.find (n_iface);
-  if (ci != m_database.end ())
+  if (n_iface < m_database.size ())
     {
-      return ci->second;
+      return m_database[n_iface];
     }
   return nullptr;
 }
@@ -147,18 +153,21 @@ NeighborStatusEntry::GetStatusUnit (uint32_t n_iface) const
 uint32_t
 NeighborStatusEntry::GetNumStatusUnit () const
 {
-  return m_database.size ();
+  return m_size;
 }
 
 void
 NeighborStatusEntry::Print (std::ostream &os) const
 {
   os << "Next_Iface    StatusUnit" << std::endl;
-  NSMap_t::const_iterator ci;
-  for (ci = m_database.begin (); ci != m_database.end (); ci ++)
+  for (uint32_t i = 0; i < m_database.size (); i ++)
     {
-      os << ci->first << "    ";
-      ci->second->Print (os);
+      if (m_database[i] == nullptr)
+        {
+          continue;
+        }
+      os << i << "    ";
+      m_database[i]->Print (os);
     }
 }
 
@@ -201,10 +210,9 @@ TSDB::GetNeighborStatusEntry (uint32_t iface) const
   //
   // Look up a NSE by it's interface.
   //
-  TSDBMap_t::const_iterator ci = m_database.find (iface);
-  if (ci != m_database.end ())
+  if (iface < m_database.size ())
     {
-      return ci->second;
+      return m_database[iface];
     }
   return nullptr;
 }
@@ -216,10 +224,9 @@ TSDB::HandleNeighborStatusEntry (uint32_t iface)
   //
   // Look up a NSE by it's interface.
   //
-  TSDBMap_t::iterator iter = m_database.find (iface);
-  if (iter != m_database.end ())
+  if (iface < m_database.size ())
     {
-      return iter->second;
+      return m_database[iface];
     }
   return nullptr;
 }
@@ -229,29 +236,30 @@ void
 TSDB::Insert (uint32_t iface, NeighborStatusEntry* nse)
 {
   // NS_LOG_FUNCTION (this << iface << nse);
-  TSDBMap_t::iterator it = m_database.find (iface);
-  if (it != m_database.end ())
+  if (iface >= m_database.size ())
     {
-      std::cout << "Find a current nse" << std::endl;
-      it->second = nse;
+      m_database.resize (iface + 1, nullptr);
     }
-  else
+  if (m_database[iface] != nullptr)
     {
-      // std::cout << "not find, insert a new one";
-      m_database.insert (NSDBPair_t (iface, nse));
+      std::cout << "Find a current nse" << std::endl;
     }
+  m_database[iface] = nse;
 }
 
 void
 TSDB::Print (std::ostream &os) const
 {
   os << "At node: ???" << std::endl;
-  TSDBMap_t::const_iterator ci;
   std::cout << "const iterator";
-  for (ci = m_database.begin (); ci != m_database.end (); ci ++)
+  for (uint32_t i = 0; i < m_database.size (); i ++)
     {
-      os << "Interface = " << ci->first << std::endl;
-      ci->second->Print (os);
+      if (m_database[i] == nullptr)
+        {
+          continue;
+        }
+      os << "Interface = " << i << std::endl;
+      m_database[i]->Print (os);
     }
 
 }
@@ -5,6 +5,7 @@
 #define STATESIZE 10
 #include "ns3/core-module.h"
 #include <map>
+#include <vector>
 #include <utility>
 #include "database.h"
 namespace ns3 {
@@ -23,6 +24,8 @@ class StatusUnit
     void Print (std::ostream &os) const;
   private:
     int m_matrix[STATESIZE][STATESIZE];
+    int m_rowCount[STATESIZE];  /** number of transitions out of each state */
+    int m_rowWeight[STATESIZE]; /** sum of the target states of those transitions */
     int m_state; /** last state */
 };
 
@@ -38,11 +41,10 @@ public:
   void Print (std::ostream &os) const;
   
 private:
-  typedef std::map<uint32_t, StatusUnit*>
-      NSMap_t; /** status, statistic*/
-  typedef std::pair<uint32_t, StatusUnit*> 
-      NSPair_t; //!< pair of <interface, StatusUnit>
+  typedef std::vector<StatusUnit*>
+      NSMap_t; /** status, statistic, indexed by neighbor interface */
   NSMap_t m_database;
+  uint32_t m_size; //!< number of StatusUnits stored
 };
 
 
@@ -111,14 +113,10 @@ class TSDB : public Database
     void Print (std::ostream &os) const override;
 
   private:
-    typedef std::map<uint32_t, NeighborStatusEntry*> 
-        TSDBMap_t;  //!< container of <interface, NeighborStatusEntry>
-    typedef std::pair<uint32_t, NeighborStatusEntry*> 
-        NSDBPair_t; //!< pair of <interface, NeighborStatusEntry>
-    typedef std::map<uint32_t, NeighborStatusEntry*>::iterator
-        NeighborStatusMapI; //!< NSE type iterator
-    typedef std::map<uint32_t, NeighborStatusEntry*>::const_iterator
-        NeighborStatusMapCI; //!< NSE type const iterator
+    // Interfaces are small dense indices, so the entries are stored in a
+    // vector indexed by interface number (nullptr if absent) instead of a map.
+    typedef std::vector<NeighborStatusEntry*> 
+        TSDBMap_t;  //!< container of NeighborStatusEntry, indexed by interface
     TSDBMap_t m_database; //!< database of <interface, NeighborStatusEntry>
 };
 
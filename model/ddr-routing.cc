@@ -231,9 +231,10 @@ DDRRouting::RouteInput(Ptr<const Packet> p,
     if (rtentry)
     {
         // std::cout << "find a way" << std::endl;
+        // p_copy is already private to this packet, hand it on as is
         if (p_copy)
         {
-            p = p_copy->Copy();
+            p = p_copy;
         }
         NS_LOG_LOGIC("Found unicast destination- calling unicast callback");
         ucb(rtentry, p, header);
@@ -312,49 +313,61 @@ void
 DDRRouting::PrintRoutingTable(Ptr<OutputStreamWrapper> stream, Time::Unit unit) const
 {
     NS_LOG_FUNCTION(this << stream);
-    std::ostream* os = stream->GetStream();
-    // Copy the current ostream state
-    std::ios oldState(nullptr);
-    oldState.copyfmt(*os);
+    // Format the whole table in memory and hand it to the stream in a single write
+    std::ostringstream table;
+    std::ostream* os = &table;
 
     *os << "Node: " << m_ipv4->GetObject<Node>()->GetId() << ", Time: " << Now().As(unit)
         << ", Local time: " << m_ipv4->GetObject<Node>()->GetLocalTime().As(unit)
-        << ", DDRRouting table" << std::endl;
+        << ", DDRRouting table\n";
 
     if (GetNRoutes() > 0)
     {
-        *os << "  Destination     Gateway    Flags   Metric  Iface   NextIface" << std::endl;
-        for (uint32_t j = 0; j < GetNRoutes(); j++)
+        *os << "  Destination     Gateway    Flags   Metric  Iface   NextIface\n";
+        // Walk the route lists in GetRoute() order rather than indexing them, which
+        // rescans the lists and copies every entry
+        std::vector<const ShortestPathForestRIE*> routes;
+        routes.reserve(GetNRoutes());
+        routes.insert(routes.end(), m_hostRoutes.begin(), m_hostRoutes.end());
+        routes.insert(routes.end(), m_networkRoutes.begin(), m_networkRoutes.end());
+        routes.insert(routes.end(), m_ASexternalRoutes.begin(), m_ASexternalRoutes.end());
+        // Resolve each interface name once, many routes share an interface
+        std::vector<std::string> ifaceNames(m_ipv4->GetNInterfaces());
+        for (uint32_t i = 0; i < ifaceNames.size(); i++)
         {
-            std::ostringstream dest, gw, mask, flags, metric;
-            ShortestPathForestRIE route = GetRoute(j);
+            ifaceNames[i] = Names::FindName(m_ipv4->GetNetDevice(i));
+        }
+        for (const ShortestPathForestRIE* entry : routes)
+        {
+            std::ostringstream dest, gw;
+            const ShortestPathForestRIE& route = *entry;
             dest << route.GetDest();
             *os << std::setw(13) << dest.str();
             gw << route.GetGateway();
             *os << std::setw(13) << gw.str();
-            flags << "U";
+            const char* flags = "U";
             if (route.IsHost())
             {
-                flags << "H";
+                flags = "UH";
             }
             else if (route.IsGateway())
             {
-                flags << "G";
+                flags = "UG";
             }
-            *os << std::setiosflags(std::ios::left) << std::setw(6) << flags.str();
-            metric << route.GetDistance();
+            *os << std::setiosflags(std::ios::left) << std::setw(6) << flags;
             if (route.GetDistance() == 0xffffffff)
             {
                 *os << std::setw(9) << "-";
             }
             else
             {
-                *os << std::setw(9) << metric.str();
+                *os << std::setw(9) << route.GetDistance();
             }
 
-            if (Names::FindName(m_ipv4->GetNetDevice(route.GetInterface())) != "")
+            const std::string& ifaceName = ifaceNames[route.GetInterface()];
+            if (!ifaceName.empty())
             {
-                *os << Names::FindName(m_ipv4->GetNetDevice(route.GetInterface()));
+                *os << ifaceName;
             }
             else
             {
@@ -368,11 +381,11 @@ DDRRouting::PrintRoutingTable(Ptr<OutputStreamWrapper> stream, Time::Unit unit)
                     *os << std::setw(8) << "-";
                 }
             }
-            *os << std::endl;
+            *os << '\n';
         }
     }
-    *os << std::endl;
-    (*os).copyfmt(oldState);
+    *os << '\n';
+    *stream->GetStream() << table.str();
 }
 
 void
@@ -567,9 +580,8 @@ DDRRouting::LookupECMPRoute(Ipv4Address dest, Ptr<NetDevice> oif)
     NS_LOG_LOGIC("Looking for route for destination " << dest);
 
     Ptr<Ipv4Route> rtentry = 0;
-    // store all available routes that bring packets to their destination
-    typedef std::vector<ShortestPathForestRIE*> RouteVec_t;
-    RouteVec_t allRoutes;
+    // keep the shortest of the routes that bring packets to their destination
+    ShortestPathForestRIE* route = nullptr;
 
     NS_LOG_LOGIC("Number of m_hostRoutes = " << m_hostRoutes.size());
     for (HostRoutesCI i = m_hostRoutes.begin(); i != m_hostRoutes.end(); i++)
@@ -585,24 +597,15 @@ DDRRouting::LookupECMPRoute(Ipv4Address dest, Ptr<NetDevice> oif)
                     continue;
                 }
             }
-            allRoutes.push_back(*i);
-            NS_LOG_LOGIC(allRoutes.size() << "Found DGR host route" << *i);
-        }
-    }
-    if (allRoutes.size() > 0) // if route(s) is found
-    {
-        uint32_t routRef = 0;
-        uint32_t shortestDist = allRoutes.at(0)->GetDistance();
-        for (uint32_t i = 0; i < allRoutes.size(); i++)
-        {
-            if (allRoutes.at(i)->GetDistance() < shortestDist)
+            if (route == nullptr || (*i)->GetDistance() < route->GetDistance())
             {
-                routRef = i;
-                shortestDist = allRoutes.at(i)->GetDistance();
+                route = *i;
             }
+            NS_LOG_LOGIC("Found DGR host route" << *i);
         }
-        ShortestPathForestRIE* route = allRoutes.at(routRef);
-
+    }
+    if (route != nullptr) // if route(s) is found
+    {
         // create a Ipv4Route object from the selected routing table entry
         rtentry = Create<Ipv4Route>();
         rtentry->SetDestination(route->GetDest());
@@ -630,40 +633,44 @@ DDRRouting::LookupDDRRoute(Ipv4Address dest, Ptr<Packet> p, Ptr<const NetDevice>
     DistTag distTag;
     uint32_t dist = UINT32_MAX;
     dist -= 1;
-    if (p->PeekPacketTag(distTag))
+    bool hasDistTag = p->PeekPacketTag(distTag);
+    if (hasDistTag)
     {
         dist = distTag.GetDistance();
     }
 
     // budget in microseconds
     uint32_t bgt;
-    if (bgtTag.GetBudget() + timeTag.GetTimestamp().GetMicroSeconds() <
-        Simulator::Now().GetMicroSeconds())
+    int64_t deadline = bgtTag.GetBudget() + timeTag.GetTimestamp().GetMicroSeconds();
+    int64_t now = Simulator::Now().GetMicroSeconds();
+    if (deadline < now)
     {
         bgt = 0;
     }
     else
     {
-        bgt = (bgtTag.GetBudget() + timeTag.GetTimestamp().GetMicroSeconds() -
-               Simulator::Now().GetMicroSeconds());
+        bgt = (deadline - now);
     }
     NS_LOG_FUNCTION(this << dest << idev);
     NS_LOG_LOGIC("Looking for route for destination " << dest);
     Ptr<Ipv4Route> rtentry = 0;
-    // store all available routes that bring packets to their destination
-    typedef std::vector<ShortestPathForestRIE*> RouteVec_t;
-    // typedef std::vector<ShortestPathForestRIE *>::const_iterator RouteVecCI_t;
-    RouteVec_t allRoutes;
+    // keep the shortest of the routes that bring packets to their destination
+    ShortestPathForestRIE* route = nullptr;
 
+    // The traffic control layer is the same for every candidate route
+    Ptr<TrafficControlLayer> tc = m_ipv4->GetObject<Node>()->GetObject<TrafficControlLayer>();
     NS_LOG_LOGIC("Number of m_hostRoutes = " << m_hostRoutes.size());
     for (HostRoutesCI i = m_hostRoutes.begin(); i != m_hostRoutes.end(); i++)
     {
         NS_ASSERT((*i)->IsHost());
         if ((*i)->GetDest() == dest)
         {
+            // the outgoing interface and its device serve every check below
+            uint32_t iface = (*i)->GetInterface();
+            Ptr<NetDevice> dev_local = m_ipv4->GetNetDevice(iface);
             if (idev)
             {
-                if (idev == m_ipv4->GetNetDevice((*i)->GetInterface()))
+                if (idev == dev_local)
                 {
                     NS_LOG_LOGIC("Not on requested interface, skipping");
                     continue;
@@ -671,15 +678,11 @@ DDRRouting::LookupDDRRoute(Ipv4Address dest, Ptr<Packet> p, Ptr<const NetDevice>
             }
 
             // if interface is down, continue
-            if (!m_ipv4->IsUp((*i)->GetInterface()))
+            if (!m_ipv4->IsUp(iface))
                 continue;
 
-            // get the local queue delay in microsecond
-            Ptr<NetDevice> dev_local = m_ipv4->GetNetDevice((*i)->GetInterface());
-            // get the queue disc on the device
-            Ptr<QueueDisc> disc = m_ipv4->GetObject<Node>()
-                                      ->GetObject<TrafficControlLayer>()
-                                      ->GetRootQueueDiscOnDevice(dev_local);
+            // get the local queue delay in microsecond from the queue disc on the device
+            Ptr<QueueDisc> disc = tc->GetRootQueueDiscOnDevice(dev_local);
             Ptr<DDRQueueDisc> dvq = DynamicCast<DDRQueueDisc>(disc);
             // uint32_t status_local = dvq->GetQueueStatus ();
             // uint32_t delay_local = status_local * 2000;
@@ -689,7 +692,6 @@ DDRRouting::LookupDDRRoute(Ipv4Address dest, Ptr<Packet> p, Ptr<const NetDevice>
             uint32_t delay_neighbor = 0;
             if ((*i)->GetNextIface() != 0xffffffff)
             {
-                uint32_t iface = (*i)->GetInterface();
                 uint32_t niface = (*i)->GetNextIface();
                 NeighborStatusEntry* entry = m_tsdb.GetNeighborStatusEntry(iface);
                 StatusUnit* su = entry->GetStatusUnit(niface);
@@ -712,25 +714,15 @@ DDRRouting::LookupDDRRoute(Ipv4Address dest, Ptr<Packet> p, Ptr<const NetDevice>
                 continue;
             }
 
-            allRoutes.push_back(*i);
-            NS_LOG_LOGIC(allRoutes.size()
-                         << "Found DGR host route" << *i << " with Cost: " << (*i)->GetDistance());
-        }
-    }
-    if (allRoutes.size() > 0) // if route(s) is found
-    {
-        uint32_t selectIndex = 0;
-        uint32_t shortestDist = allRoutes.at(0)->GetDistance();
-        for (uint32_t i = 0; i < allRoutes.size(); i++)
-        {
-            if (allRoutes.at(i)->GetDistance() < shortestDist)
+            if (route == nullptr || (*i)->GetDistance() < route->GetDistance())
             {
-                selectIndex = i;
-                shortestDist = allRoutes.at(i)->GetDistance();
+                route = *i;
             }
+            NS_LOG_LOGIC("Found DGR host route" << *i << " with Cost: " << (*i)->GetDistance());
         }
-
-        ShortestPathForestRIE* route = allRoutes.at(selectIndex);
+    }
+    if (route != nullptr) // if route(s) is found
+    {
         uint32_t interfaceIdx = route->GetInterface();
 
         rtentry = Create<Ipv4Route>();
@@ -740,8 +732,12 @@ DDRRouting::LookupDDRRoute(Ipv4Address dest, Ptr<Packet> p, Ptr<const NetDevice>
         rtentry->SetGateway(route->GetGateway());
         rtentry->SetOutputDevice(m_ipv4->GetNetDevice(interfaceIdx));
 
-        distTag.SetDistance(route->GetDistance());
-        p->ReplacePacketTag(distTag);
+        // only rewrite the tag when the remaining distance changes
+        if (!hasDistTag || route->GetDistance() != dist)
+        {
+            distTag.SetDistance(route->GetDistance());
+            p->ReplacePacketTag(distTag);
+        }
         return rtentry;
     }
     else
@@ -762,7 +758,8 @@ DDRRouting::LookupDGRRoute(Ipv4Address dest, Ptr<Packet> p, Ptr<const NetDevice>
     DistTag distTag;
     uint32_t dist = UINT32_MAX;
     dist -= 1;
-    if (p->PeekPacketTag(distTag))
+    bool hasDistTag = p->PeekPacketTag(distTag);
+    if (hasDistTag)
     {
         dist = distTag.GetDistance();
     }
@@ -770,15 +767,15 @@ DDRRouting::LookupDGRRoute(Ipv4Address dest, Ptr<Packet> p, Ptr<const NetDevice>
     // std::cout << "budget: " << bgtTag.GetBudget() << std::endl;
     // budget in microseconds
     uint32_t bgt;
-    if (bgtTag.GetBudget() + timeTag.GetTimestamp().GetMicroSeconds() <
-        Simulator::Now().GetMicroSeconds())
+    int64_t deadline = bgtTag.GetBudget() + timeTag.GetTimestamp().GetMicroSeconds();
+    int64_t now = Simulator::Now().GetMicroSeconds();
+    if (deadline < now)
     {
         bgt = 0;
     }
     else
     {
-        bgt = (bgtTag.GetBudget() + timeTag.GetTimestamp().GetMicroSeconds() -
-               Simulator::Now().GetMicroSeconds());
+        bgt = (deadline - now);
     }
     NS_LOG_FUNCTION(this << dest << idev);
     NS_LOG_LOGIC("Looking for route for destination " << dest);
@@ -788,15 +785,20 @@ DDRRouting::LookupDGRRoute(Ipv4Address dest, Ptr<Packet> p, Ptr<const NetDevice>
     // typedef std::vector<ShortestPathForestRIE *>::const_iterator RouteVecCI_t;
     RouteVec_t allRoutes;
 
+    // The traffic control layer is the same for every candidate route
+    Ptr<TrafficControlLayer> tc = m_ipv4->GetObject<Node>()->GetObject<TrafficControlLayer>();
     NS_LOG_LOGIC("Number of m_hostRoutes = " << m_hostRoutes.size());
     for (HostRoutesCI i = m_hostRoutes.begin(); i != m_hostRoutes.end(); i++)
     {
         NS_ASSERT((*i)->IsHost());
         if ((*i)->GetDest() == dest)
         {
+            // the outgoing interface and its device serve every check below
+            uint32_t iface = (*i)->GetInterface();
+            Ptr<NetDevice> dev_local = m_ipv4->GetNetDevice(iface);
             if (idev)
             {
-                if (idev == m_ipv4->GetNetDevice((*i)->GetInterface()))
+                if (idev == dev_local)
                 {
                     NS_LOG_LOGIC("Not on requested interface, skipping");
                     continue;
@@ -804,15 +806,11 @@ DDRRouting::LookupDGRRoute(Ipv4Address dest, Ptr<Packet> p, Ptr<const NetDevice>
             }
 
             // if interface is down, continue
-            if (!m_ipv4->IsUp((*i)->GetInterface()))
+            if (!m_ipv4->IsUp(iface))
                 continue;
 
-            // get the local queue delay in microsecond
-            Ptr<NetDevice> dev_local = m_ipv4->GetNetDevice((*i)->GetInterface());
-            // get the queue disc on the device
-            Ptr<QueueDisc> disc = m_ipv4->GetObject<Node>()
-                                      ->GetObject<TrafficControlLayer>()
-                                      ->GetRootQueueDiscOnDevice(dev_local);
+            // get the local queue delay in microsecond from the queue disc on the device
+            Ptr<QueueDisc> disc = tc->GetRootQueueDiscOnDevice(dev_local);
             Ptr<DDRQueueDisc> dvq = DynamicCast<DDRQueueDisc>(disc);
             // uint32_t status_local = dvq->GetQueueStatus ();
             // uint32_t delay_local = status_local * 2000;
@@ -822,7 +820,6 @@ DDRRouting::LookupDGRRoute(Ipv4Address dest, Ptr<Packet> p, Ptr<const NetDevice>
             uint32_t delay_neighbor = 0;
             if ((*i)->GetNextIface() != 0xffffffff)
             {
-                uint32_t iface = (*i)->GetInterface();
                 uint32_t niface = (*i)->GetNextIface();
                 NeighborStatusEntry* entry = m_tsdb.GetNeighborStatusEntry(iface);
                 StatusUnit* su = entry->GetStatusUnit(niface);
@@ -863,8 +860,12 @@ DDRRouting::LookupDGRRoute(Ipv4Address dest, Ptr<Packet> p, Ptr<const NetDevice>
         rtentry->SetGateway(route->GetGateway());
         rtentry->SetOutputDevice(m_ipv4->GetNetDevice(interfaceIdx));
 
-        distTag.SetDistance(route->GetDistance());
-        p->ReplacePacketTag(distTag);
+        // only rewrite the tag when the remaining distance changes
+        if (!hasDistTag || route->GetDistance() != dist)
+        {
+            distTag.SetDistance(route->GetDistance());
+            p->ReplacePacketTag(distTag);
+        }
         return rtentry;
     }
     else
@@ -880,7 +881,8 @@ DDRRouting::LookupKShortRoute(Ipv4Address dest, Ptr<Packet> p, Ptr<const NetDevi
     DistTag distTag;
     uint32_t dist = UINT32_MAX;
     dist -= 1;
-    if (p->PeekPacketTag(distTag))
+    bool hasDistTag = p->PeekPacketTag(distTag);
+    if (hasDistTag)
     {
         dist = distTag.GetDistance();
     }
@@ -925,8 +927,12 @@ DDRRouting::LookupKShortRoute(Ipv4Address dest, Ptr<Packet> p, Ptr<const NetDevi
         rtentry->SetGateway(route->GetGateway());
         rtentry->SetOutputDevice(m_ipv4->GetNetDevice(interfaceIdx));
 
-        distTag.SetDistance(route->GetDistance());
-        p->ReplacePacketTag(distTag);
+        // only rewrite the tag when the remaining distance changes
+        if (!hasDistTag || route->GetDistance() != dist)
+        {
+            distTag.SetDistance(route->GetDistance());
+            p->ReplacePacketTag(distTag);
+        }
         return rtentry;
     }
     else
@@ -1086,17 +1092,16 @@ DDRRouting::InitializeSocketList()
     Time delay = m_unsolicitedUpdate;
     m_nextUnsolicitedUpdate = Simulator::Schedule(delay, &DDRRouting::SendUnsolicitedUpdate, this);
 
-    uint32_t nodeId = m_ipv4->GetNetDevice(1)->GetNode()->GetId();
-    std::stringstream ss;
-    ss << nodeId;
-    std::string strNodeId = ss.str();
-
     // // std::string node = "Node " + (std::string)nodeId;
     // m_outStream = Create<OutputStreamWrapper> ("Node" + strNodeId + "queueStatusErr.txt",
     // std::ios::out);
 
     m_nextUnsolicitedUpdate = Simulator::Schedule(delay, &DDRRouting::SendUnsolicitedUpdate, this);
 
+    // The socket factory and node are the same for every socket, resolve them once
+    TypeId tid = UdpSocketFactory::GetTypeId();
+    Ptr<Node> theNode = m_ipv4->GetObject<Node>();
+
     // Initialize the sockets for every netdevice
     for (uint32_t i = 0; i < m_ipv4->GetNInterfaces(); i++)
     {
@@ -1122,8 +1127,6 @@ DDRRouting::InitializeSocketList()
             if (address.GetScope() != Ipv4InterfaceAddress::HOST && activeInterface == true)
             {
                 NS_LOG_LOGIC("DGR: add socket to " << address.GetLocal());
-                TypeId tid = TypeId::LookupByName("ns3::UdpSocketFactory");
-                Ptr<Node> theNode = m_ipv4->GetObject<Node>();
                 Ptr<Socket> socket = Socket::CreateSocket(theNode, tid);
 
                 InetSocketAddress local = InetSocketAddress(address.GetLocal(), DDR_PORT);
@@ -1143,8 +1146,6 @@ DDRRouting::InitializeSocketList()
     if (!m_multicastRecvSocket)
     {
         NS_LOG_LOGIC("DGR: adding receiving socket");
-        TypeId tid = TypeId::LookupByName("ns3::UdpSocketFactory");
-        Ptr<Node> theNode = m_ipv4->GetObject<Node>();
         m_multicastRecvSocket = Socket::CreateSocket(theNode, tid);
         InetSocketAddress local = InetSocketAddress(DDR_BROAD_CAST, DDR_PORT);
         m_multicastRecvSocket->Bind(local);
@@ -1271,47 +1272,56 @@ void
 DDRRouting::DoSendNeighborStatusUpdate(bool periodic)
 {
     NS_LOG_FUNCTION(this << (periodic ? " periodic" : " triggered"));
+    // Find the Status of every netdevice once, it is the same for every neighbor
+    // TODO: Finish this function when finish the NSE definiation
+    std::vector<DgrNse> nses;
+    Ptr<TrafficControlLayer> tc = m_ipv4->GetObject<Node>()->GetObject<TrafficControlLayer>();
+    for (uint32_t i = 0; i < m_ipv4->GetNInterfaces(); i++)
+    {
+        if (!m_ipv4->IsUp(i))
+            continue;
+        Ptr<LoopbackNetDevice> check = DynamicCast<LoopbackNetDevice>(m_ipv4->GetNetDevice(i));
+        if (check)
+        {
+            continue;
+        }
+        // get the device
+        Ptr<NetDevice> dev = m_ipv4->GetNetDevice(i);
+        // get the queue disc on devic
+        Ptr<QueueDisc> disc = tc->GetRootQueueDiscOnDevice(dev);
+        Ptr<DDRQueueDisc> qdisc = DynamicCast<DDRQueueDisc>(disc);
+        DgrNse nse;
+        nse.SetInterface(i);
+        nse.SetState(qdisc->GetQueueStatus());
+        nses.push_back(nse);
+    }
+
+    // Per-message overhead and the size of one NSE do not depend on the interface
+    uint32_t headerSize = Ipv4Header().GetSerializedSize() + UdpHeader().GetSerializedSize() +
+                          DgrHeader().GetSerializedSize();
+    uint32_t nseSize = DgrNse().GetSerializedSize();
+    SocketIpTtlTag ttlTag;
+    ttlTag.SetTtl(1);
+
     for (SocketListI iter = m_unicastSocketList.begin(); iter != m_unicastSocketList.end(); iter++)
     {
         uint32_t interface = iter->second;
         if (m_interfaceExclusions.find(interface) == m_interfaceExclusions.end())
         {
             uint16_t mtu = m_ipv4->GetMtu(interface);
-            uint16_t maxNse = (mtu - Ipv4Header().GetSerializedSize() -
-                               UdpHeader().GetSerializedSize() - DgrHeader().GetSerializedSize()) /
-                              DgrNse().GetSerializedSize();
-            Ptr<Packet> p = Create<Packet>();
-            SocketIpTtlTag ttlTag;
-            ttlTag.SetTtl(1);
-            p->AddPacketTag(ttlTag);
+            uint16_t maxNse = (mtu - headerSize) / nseSize;
 
             DgrHeader hdr;
             hdr.SetCommand(DgrHeader::RESPONSE);
-            // Find the Status of every netdevice and put it in
-            // TODO: Finish this function when finish the NSE definiation
-            for (uint32_t i = 0; i < m_ipv4->GetNInterfaces(); i++)
+            for (const DgrNse& nse : nses)
             {
-                if (!m_ipv4->IsUp(i))
-                    continue;
-                Ptr<LoopbackNetDevice> check =
-                    DynamicCast<LoopbackNetDevice>(m_ipv4->GetNetDevice(i));
-                if (check)
-                {
-                    continue;
-                }
-                // get the device
-                Ptr<NetDevice> dev = m_ipv4->GetNetDevice(i);
-                // get the queue disc on devic
-                Ptr<QueueDisc> disc = m_ipv4->GetObject<Node>()
-                                          ->GetObject<TrafficControlLayer>()
-                                          ->GetRootQueueDiscOnDevice(dev);
-                Ptr<DDRQueueDisc> qdisc = DynamicCast<DDRQueueDisc>(disc);
-                DgrNse nse;
-                nse.SetInterface(i);
-                nse.SetState(qdisc->GetQueueStatus());
                 hdr.AddNse(nse);
                 if (hdr.GetNseNumber() == maxNse)
                 {
+                    // Start each full message from a fresh packet instead of stripping
+                    // (and deserializing) the header of the previous one
+                    Ptr<Packet> p = Create<Packet>();
+                    p->AddPacketTag(ttlTag);
                     p->AddHeader(hdr);
                     NS_LOG_DEBUG("SendTo: " << *p);
                     iter->first->SendTo(
@@ -1319,12 +1329,13 @@ DDRRouting::DoSendNeighborStatusUpdate(bool periodic)
                         0,
                         InetSocketAddress(DDR_BROAD_CAST,
                                           DDR_PORT)); // Todo : defind the port for DGR routing
-                    p->RemoveHeader(hdr);
                     hdr.ClearNses();
                 }
             }
             if (hdr.GetNseNumber() > 0)
             {
+                Ptr<Packet> p = Create<Packet>();
+                p->AddPacketTag(ttlTag);
                 p->AddHeader(hdr);
                 NS_LOG_DEBUG("SendTo: " << *p);
                 iter->first->SendTo(
@@ -1337,7 +1348,7 @@ DDRRouting::DoSendNeighborStatusUpdate(bool periodic)
 }
 
 void
-DDRRouting::HandleResponses(DgrHeader hdr,
+DDRRouting::HandleResponses(const DgrHeader& hdr,
                             Ipv4Address senderAddress,
                             uint32_t incomingInterface,
                             uint8_t hopLimit)
@@ -1361,8 +1372,8 @@ DDRRouting::HandleResponses(DgrHeader hdr,
         m_tsdb.Insert(incomingInterface, entry);
     }
 
-    std::list<DgrNse> nses = hdr.GetNseList();
-    for (std::list<DgrNse>::iterator iter = nses.begin(); iter != nses.end(); iter++)
+    const std::list<DgrNse>& nses = hdr.GetNseList();
+    for (std::list<DgrNse>::const_iterator iter = nses.begin(); iter != nses.end(); iter++)
     {
         uint32_t n_iface = (*iter).GetInterface();
         int n_state = (*iter).GetState();
@@ -247,7 +247,7 @@ class DDRRouting : public RomamRouting
      * \param incomingInterface incoming interface
      * \param hopLimit packet's hop limit
      */
-    void HandleResponses(DgrHeader hdr,
+    void HandleResponses(const DgrHeader& hdr,
                          Ipv4Address senderAddress,
                          uint32_t incomingInterface,
                          uint8_t hopLimit);
@@ -124,7 +124,6 @@ DGRRouting::RouteInput(Ptr<const Packet> p,
     NS_LOG_FUNCTION(this << p << header << header.GetSource() << header.GetDestination() << idev
                          << &lcb << &ecb);
     NS_ASSERT(m_ipv4->GetInterfaceForDevice(idev) >= 0);
-    Ptr<Packet> p_copy = p->Copy();
 
     // Check if input device supports IP
     uint32_t iif = m_ipv4->GetInterfaceForDevice(idev);
@@ -160,8 +159,12 @@ DGRRouting::RouteInput(Ptr<const Packet> p,
     NS_LOG_LOGIC("Unicast destination- looking up global route");
     Ptr<Ipv4Route> rtentry;
     BudgetTag budgetTag;
+    // Only the DGR lookup rewrites packet tags, so only that path needs a
+    // writable copy; it is handed on as is.
+    Ptr<Packet> p_copy;
     if (p->PeekPacketTag(budgetTag) && budgetTag.GetBudget() != 0)
     {
+        p_copy = p->Copy();
         rtentry = LookupDGRRoute(header.GetDestination(), p_copy, idev);
     }
     else
@@ -171,9 +174,12 @@ DGRRouting::RouteInput(Ptr<const Packet> p,
 
     if (rtentry)
     {
-        const Ptr<Packet> p_c = p_copy->Copy();
+        if (p_copy)
+        {
+            p = p_copy;
+        }
         NS_LOG_LOGIC("Found unicast destination- calling unicast callback");
-        ucb(rtentry, p_c, header);
+        ucb(rtentry, p, header);
         return true;
     }
     else
@@ -248,55 +254,64 @@ void
 DGRRouting::PrintRoutingTable(Ptr<OutputStreamWrapper> stream, Time::Unit unit) const
 {
     NS_LOG_FUNCTION(this << stream);
-    std::ostream* os = stream->GetStream();
-    // Copy the current ostream state
-    std::ios oldState(nullptr);
-    oldState.copyfmt(*os);
+    // Format the whole table in memory and hand it to the stream in a single write
+    std::ostringstream table;
+    std::ostream* os = &table;
 
     *os << std::resetiosflags(std::ios::adjustfield) << std::setiosflags(std::ios::left);
 
     *os << "Node: " << m_ipv4->GetObject<Node>()->GetId() << ", Time: " << Now().As(unit)
         << ", Local time: " << m_ipv4->GetObject<Node>()->GetLocalTime().As(unit)
-        << ", DGRRouting table" << std::endl;
+        << ", DGRRouting table\n";
 
     if (GetNRoutes() > 0)
     {
-        *os << "  Destination     Gateway    Flags   Metric  Iface   NextIface" << std::endl;
-        for (uint32_t j = 0; j < GetNRoutes(); j++)
+        *os << "  Destination     Gateway    Flags   Metric  Iface   NextIface\n";
+        // Walk the route lists in GetRoute() order rather than indexing them, which
+        // rescans the lists and copies every entry
+        std::vector<const ShortestPathForestRIE*> routes;
+        routes.reserve(GetNRoutes());
+        routes.insert(routes.end(), m_hostRoutes.begin(), m_hostRoutes.end());
+        routes.insert(routes.end(), m_networkRoutes.begin(), m_networkRoutes.end());
+        routes.insert(routes.end(), m_ASexternalRoutes.begin(), m_ASexternalRoutes.end());
+        // Resolve each interface name once, many routes share an interface
+        std::vector<std::string> ifaceNames(m_ipv4->GetNInterfaces());
+        for (uint32_t i = 0; i < ifaceNames.size(); i++)
+        {
+            ifaceNames[i] = Names::FindName(m_ipv4->GetNetDevice(i));
+        }
+        for (const ShortestPathForestRIE* entry : routes)
         {
             std::ostringstream dest;
             std::ostringstream gw;
-            std::ostringstream mask;
-            std::ostringstream flags;
-            std::ostringstream metric;
-            ShortestPathForestRIE route = GetRoute(j);
+            const ShortestPathForestRIE& route = *entry;
             dest << route.GetDest();
             *os << std::setw(13) << dest.str();
             gw << route.GetGateway();
             *os << std::setw(13) << gw.str();
-            flags << "U";
+            const char* flags = "U";
             if (route.IsHost())
             {
-                flags << "H";
+                flags = "UH";
             }
             else if (route.IsGateway())
             {
-                flags << "G";
+                flags = "UG";
             }
-            *os << std::setiosflags(std::ios::left) << std::setw(6) << flags.str();
-            metric << route.GetDistance();
+            *os << std::setiosflags(std::ios::left) << std::setw(6) << flags;
             if (route.GetDistance() == 0xffffffff)
             {
                 *os << std::setw(9) << "-";
             }
             else
             {
-                *os << std::setw(9) << metric.str();
+                *os << std::setw(9) << route.GetDistance();
             }
 
-            if (Names::FindName(m_ipv4->GetNetDevice(route.GetInterface())) != "")
+            const std::string& ifaceName = ifaceNames[route.GetInterface()];
+            if (!ifaceName.empty())
             {
-                *os << Names::FindName(m_ipv4->GetNetDevice(route.GetInterface()));
+                *os << ifaceName;
             }
             else
             {
@@ -310,11 +325,11 @@ DGRRouting::PrintRoutingTable(Ptr<OutputStreamWrapper> stream, Time::Unit unit)
                     *os << std::setw(8) << "-";
                 }
             }
-            *os << std::endl;
+            *os << '\n';
         }
     }
-    *os << std::endl;
-    (*os).copyfmt(oldState);
+    *os << '\n';
+    *stream->GetStream() << table.str();
 }
 
 void
@@ -567,38 +582,42 @@ DGRRouting::LookupDGRRoute(Ipv4Address dest, Ptr<Packet> p, Ptr<const NetDevice>
     DistTag distTag;
     uint32_t dist = UINT32_MAX;
     dist -= 1;
-    if (p->PeekPacketTag(distTag))
+    bool hasDistTag = p->PeekPacketTag(distTag);
+    if (hasDistTag)
         dist = distTag.GetDistance();
     // budget in microseconds
     uint32_t bgt;
-    if (bgtTag.GetBudget() + timeTag.GetTimestamp().GetMicroSeconds() <
-        Simulator::Now().GetMicroSeconds())
+    int64_t deadline = bgtTag.GetBudget() + timeTag.GetTimestamp().GetMicroSeconds();
+    int64_t now = Simulator::Now().GetMicroSeconds();
+    if (deadline < now)
     {
         bgt = 0;
     }
     else
-        bgt = (bgtTag.GetBudget() + timeTag.GetTimestamp().GetMicroSeconds() -
-               Simulator::Now().GetMicroSeconds()) /
-              100;
+        bgt = (deadline - now) / 100;
     /**
      * Lookup a Route to forward the DGR packets.
      */
     NS_LOG_FUNCTION(this << dest << idev);
     NS_LOG_LOGIC("Looking for route for destination " << dest);
     Ptr<Ipv4Route> rtentry = 0;
-    // store all available routes that bring packets to their destination
-    typedef std::vector<ShortestPathForestRIE*> RouteVec_t;
-    RouteVec_t allRoutes;
+    // keep the shortest of the routes that bring packets to their destination
+    ShortestPathForestRIE* route = nullptr;
 
+    // The traffic control layer is the same for every candidate route
+    Ptr<TrafficControlLayer> tc = m_ipv4->GetObject<Node>()->GetObject<TrafficControlLayer>();
     NS_LOG_LOGIC("Number of m_hostRoutes = " << m_hostRoutes.size());
     for (auto i = m_hostRoutes.begin(); i != m_hostRoutes.end(); i++)
     {
         NS_ASSERT((*i)->IsHost());
         if ((*i)->GetDest() == dest)
         {
+            // the outgoing interface and its device serve every check below
+            uint32_t iface = (*i)->GetInterface();
+            Ptr<NetDevice> dev_loc = m_ipv4->GetNetDevice(iface);
             if (idev != nullptr)
             {
-                if (idev == m_ipv4->GetNetDevice((*i)->GetInterface()))
+                if (idev == dev_loc)
                 {
                     NS_LOG_LOGIC("Not on requested interface, skipping");
                     continue;
@@ -606,14 +625,11 @@ DGRRouting::LookupDGRRoute(Ipv4Address dest, Ptr<Packet> p, Ptr<const NetDevice>
             }
 
             // if interface is down, continue
-            if (!m_ipv4->IsUp((*i)->GetInterface()))
+            if (!m_ipv4->IsUp(iface))
                 continue;
 
             // get the local queue delay in microseconds
-            Ptr<NetDevice> dev_loc = m_ipv4->GetNetDevice((*i)->GetInterface());
-            Ptr<QueueDisc> disc = m_ipv4->GetObject<Node>()
-                                      ->GetObject<TrafficControlLayer>()
-                                      ->GetRootQueueDiscOnDevice(dev_loc);
+            Ptr<QueueDisc> disc = tc->GetRootQueueDiscOnDevice(dev_loc);
             Ptr<DGRQueueDisc> dgr_q = DynamicCast<DGRQueueDisc>(disc);
 
             // Get the Slow lane length
@@ -666,28 +682,15 @@ DGRRouting::LookupDGRRoute(Ipv4Address dest, Ptr<Packet> p, Ptr<const NetDevice>
             NS_LOG_LOGIC("Too far to the destination, skipping");
             continue;
         }
-        allRoutes.push_back(*i);
-        NS_LOG_LOGIC(allRoutes.size()
-                     << "Found DGR host route" << *i << " with Cost: " << (*i)->GetDistance());
-    }
-
-    if (allRoutes.size() > 0) // if route(s) is found
-    {
-        // random select
-        // uint32_t selectIndex = m_rand->GetInteger(0, allRoutes.size() - 1);
-
-        uint32_t selectIndex = 0;
-        uint32_t shortestDist = allRoutes.at(0)->GetDistance();
-        for (uint32_t i = 0; i < allRoutes.size(); i++)
+        if (route == nullptr || (*i)->GetDistance() < route->GetDistance())
         {
-            if (allRoutes.at(i)->GetDistance() < shortestDist)
-            {
-                selectIndex = i;
-                shortestDist = allRoutes.at(i)->GetDistance();
-            }
+            route = *i;
         }
+        NS_LOG_LOGIC("Found DGR host route" << *i << " with Cost: " << (*i)->GetDistance());
+    }
 
-        ShortestPathForestRIE* route = allRoutes.at(selectIndex);
+    if (route != nullptr) // if route(s) is found
+    {
         uint32_t interfaceIdx = route->GetInterface();
 
         rtentry = Create<Ipv4Route>();
@@ -706,10 +709,14 @@ DGRRouting::LookupDGRRoute(Ipv4Address dest, Ptr<Packet> p, Ptr<const NetDevice>
             prioTag.SetPriority(1);
         }
 
-        distTag.SetDistance(route->GetDistance());
         p->ReplacePacketTag(prioTag);
 
-        p->ReplacePacketTag(distTag);
+        // only rewrite the tag when the remaining distance changes
+        if (!hasDistTag || route->GetDistance() != dist)
+        {
+            distTag.SetDistance(route->GetDistance());
+            p->ReplacePacketTag(distTag);
+        }
         return rtentry;
     }
     else
@@ -222,10 +222,9 @@ void
 OctopusRouting::PrintRoutingTable(Ptr<OutputStreamWrapper> stream, Time::Unit unit) const
 {
     NS_LOG_FUNCTION(this << stream);
-    std::ostream* os = stream->GetStream();
-    // Copy the current ostream state
-    std::ios oldState(nullptr);
-    oldState.copyfmt(*os);
+    // Format the whole table in memory and hand it to the stream in a single write
+    std::ostringstream table;
+    std::ostream* os = &table;
 
     // *os << "Node: " << m_ipv4->GetObject<Node>()->GetId() << ", Time: " << Now().As(unit)
     //     << ", Local time: " << m_ipv4->GetObject<Node>()->GetLocalTime().As(unit)
@@ -233,39 +232,51 @@ OctopusRouting::PrintRoutingTable(Ptr<OutputStreamWrapper> stream, Time::Unit un
 
     if (GetNRoutes() > 0)
     {
-        *os << "  Destination     Gateway    Flags   Metric  Iface   NextIface   Loss   Pulls"
-            << std::endl;
-        for (uint32_t j = 0; j < GetNRoutes(); j++)
+        *os << "  Destination     Gateway    Flags   Metric  Iface   NextIface   Loss   Pulls\n";
+        // Walk the route lists in GetRoute() order rather than indexing them, which
+        // rescans the lists and copies every entry
+        std::vector<const ArmedSpfRIE*> routes;
+        routes.reserve(GetNRoutes());
+        routes.insert(routes.end(), m_hostRoutes.begin(), m_hostRoutes.end());
+        routes.insert(routes.end(), m_networkRoutes.begin(), m_networkRoutes.end());
+        routes.insert(routes.end(), m_ASexternalRoutes.begin(), m_ASexternalRoutes.end());
+        // Resolve each interface name once, many routes share an interface
+        std::vector<std::string> ifaceNames(m_ipv4->GetNInterfaces());
+        for (uint32_t i = 0; i < ifaceNames.size(); i++)
         {
-            std::ostringstream dest, gw, mask, flags, metric;
-            ArmedSpfRIE route = GetRoute(j);
+            ifaceNames[i] = Names::FindName(m_ipv4->GetNetDevice(i));
+        }
+        for (const ArmedSpfRIE* entry : routes)
+        {
+            std::ostringstream dest, gw;
+            const ArmedSpfRIE& route = *entry;
             dest << route.GetDest();
             *os << std::setw(13) << dest.str();
             gw << route.GetGateway();
             *os << std::setw(13) << gw.str();
-            flags << "U";
+            const char* flags = "U";
             if (route.IsHost())
             {
-                flags << "H";
+                flags = "UH";
             }
             else if (route.IsGateway())
             {
-                flags << "G";
+                flags = "UG";
             }
-            *os << std::setiosflags(std::ios::left) << std::setw(6) << flags.str();
-            metric << route.GetDistance();
+            *os << std::setiosflags(std::ios::left) << std::setw(6) << flags;
             if (route.GetDistance() == 0xffffffff)
             {
                 *os << std::setw(9) << "-";
             }
             else
             {
-                *os << std::setw(9) << metric.str();
+                *os << std::setw(9) << route.GetDistance();
             }
 
-            if (Names::FindName(m_ipv4->GetNetDevice(route.GetInterface())) != "")
+            const std::string& ifaceName = ifaceNames[route.GetInterface()];
+            if (!ifaceName.empty())
             {
-                *os << Names::FindName(m_ipv4->GetNetDevice(route.GetInterface()));
+                *os << ifaceName;
             }
             else
             {
@@ -281,11 +292,11 @@ OctopusRouting::PrintRoutingTable(Ptr<OutputStreamWrapper> stream, Time::Unit un
             }
             *os << std::setw(18) << route.GetCumulativeLoss();
             *os << std::setw(8) << route.GetNumPulls();
-            *os << std::endl;
+            *os << '\n';
         }
     }
-    *os << std::endl;
-    (*os).copyfmt(oldState);
+    *os << '\n';
+    *stream->GetStream() << table.str();
 }
 
 void
@@ -554,6 +565,10 @@ OctopusRouting::LookupRoute(Ipv4Address dest, Ptr<NetDevice> oif)
 void
 OctopusRouting::InitializeSocketList()
 {
+    // The socket factory and node are the same for every socket, resolve them once
+    TypeId tid = UdpSocketFactory::GetTypeId();
+    Ptr<Node> theNode = m_ipv4->GetObject<Node>();
+
     // Initialize the sockets for every netdevice
     for (uint32_t i = 0; i < m_ipv4->GetNInterfaces(); i++)
     {
@@ -578,8 +593,6 @@ OctopusRouting::InitializeSocketList()
             if (address.GetScope() != Ipv4InterfaceAddress::HOST && activeInterface == true)
             {
                 NS_LOG_LOGIC("Octopus: add socket to " << address.GetLocal());
-                TypeId tid = TypeId::LookupByName("ns3::UdpSocketFactory");
-                Ptr<Node> theNode = m_ipv4->GetObject<Node>();
                 Ptr<Socket> socket = Socket::CreateSocket(theNode, tid);
 
                 InetSocketAddress local = InetSocketAddress(address.GetLocal(), OCTOPUS_PORT);
@@ -592,6 +605,7 @@ OctopusRouting::InitializeSocketList()
                 socket->SetRecvPktInfo(true);
 
                 m_unicastSocketList[socket] = i;
+                m_interfaceSocket.emplace(i, socket);
             }
         }
     }
@@ -599,8 +613,6 @@ OctopusRouting::InitializeSocketList()
     if (!m_multicastRecvSocket)
     {
         NS_LOG_LOGIC("DGR: adding receiving socket");
-        TypeId tid = TypeId::LookupByName("ns3::UdpSocketFactory");
-        Ptr<Node> theNode = m_ipv4->GetObject<Node>();
         m_multicastRecvSocket = Socket::CreateSocket(theNode, tid);
         InetSocketAddress local = InetSocketAddress(OCTOPUS_BROAD_CAST, OCTOPUS_PORT);
         m_multicastRecvSocket->Bind(local);
@@ -720,34 +732,31 @@ OctopusRouting::HandleUpdate(Ipv4Address dest, uint32_t interface, double reward
 
     if (!allRoutes.empty()) // if route(s) is found
     {
-        int nRoutes = (int)allRoutes.size();
-        double p[nRoutes];
-        int ref = 0;
+        double chances = allRoutes.size() * log(allRoutes.size());
         double p_total = 0.0;
-        double chances = nRoutes * log(nRoutes);
-        ArmedSpfRIE* route;
-        int route_ref = 0;
-        for (auto i = allRoutes.begin(); i != allRoutes.end(); i++)
+        // the arm being rewarded, found while computing the probabilities
+        ArmedSpfRIE* route = nullptr;
+        double p_route = 0.0;
+        for (ArmedSpfRIE* arm : allRoutes)
         {
+            // Get the number of pulls
+            double eta = sqrt(chances / (double)arm->GetNumPulls());
+            double p = exp(-eta * arm->GetCumulativeLoss());
+            p_total += p;
             // record the right route we are finding
-            if ((*i)->GetInterface() == interface)
+            if (arm->GetInterface() == interface)
             {
-                route = *i;
-                route_ref = ref;
+                route = arm;
+                p_route = p;
             }
-            // Get the number of pulls
-            uint32_t nPulls = (*i)->GetNumPulls();
-            double loss = (*i)->GetCumulativeLoss();
-            double eta = sqrt(chances / (double)nPulls);
-            p[ref] = exp(-eta * loss);
-            p_total += p[ref];
-            ref += 1;
         }
-        // norm the probabilities
-        for (int j = 0; j < nRoutes; j++)
+        if (route == nullptr)
         {
-            p[j] = p[j] / p_total;
+            NS_LOG_LOGIC("No route to " << dest << " on interface " << interface);
+            return;
         }
+        // norm the probability of the route being updated, the others are not used
+        p_route /= p_total;
         // update arm's cumulative loss
         // check the queueing delay of current node.
         Ptr<NetDevice> odev = m_ipv4->GetNetDevice(interface);
@@ -757,24 +766,10 @@ OctopusRouting::HandleUpdate(Ipv4Address dest, uint32_t interface, double reward
         uint32_t length = disc->GetNBytes();
         double delay = length / 100.0; // delay in milliseconds
         reward += delay;
-        double delta = (1 - exp(-(route->GetDistance() + reward))) / p[route_ref];
+        double delta = (1 - exp(-(route->GetDistance() + reward))) / p_route;
         route->UpdateArm(delta);
-    }
-
-    // Find the route and upate arm
-    NS_LOG_FUNCTION(this << dest << interface << reward);
-    NS_LOG_LOGIC("Looking for this route");
-    for (auto i = m_hostRoutes.begin(); i != m_hostRoutes.end(); i++)
-    {
-        NS_ASSERT((*i)->IsHost());
-        if ((*i)->GetDest() == dest)
-        {
-            if ((*i)->GetInterface() == interface)
-            {
-                (*i)->UpdateArm(reward);
-                return;
-            }
-        }
+        // the same arm also takes the raw reward
+        route->UpdateArm(reward);
     }
 }
 
@@ -782,16 +777,8 @@ void
 OctopusRouting::SendOneHopAck(Ipv4Address dest, uint32_t iif, uint32_t oif)
 {
     NS_LOG_FUNCTION(this);
-    auto iter = m_unicastSocketList.begin();
-    for (; iter != m_unicastSocketList.end(); iter++)
-    {
-        if (iter->second == iif)
-        {
-            break;
-        }
-    }
-
-    if (iter != m_unicastSocketList.end())
+    auto iter = m_interfaceSocket.find(iif);
+    if (iter != m_interfaceSocket.end())
     {
         Ptr<NetDevice> odev = m_ipv4->GetNetDevice(oif);
         Ptr<QueueDisc> disc =
@@ -810,7 +797,7 @@ OctopusRouting::SendOneHopAck(Ipv4Address dest, uint32_t iif, uint32_t oif)
         hdr.SetDestination(dest);
         hdr.SetReward(delay);
         p->AddHeader(hdr);
-        iter->first->SendTo(p, 0, InetSocketAddress(OCTOPUS_BROAD_CAST, OCTOPUS_PORT));
+        iter->second->SendTo(p, 0, InetSocketAddress(OCTOPUS_BROAD_CAST, OCTOPUS_PORT));
     }
 }
 } // namespace ns3
\ No newline at end of file
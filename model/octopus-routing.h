@@ -155,6 +155,8 @@ class OctopusRouting : public RomamRouting
 
     SocketList
         m_unicastSocketList; //!< list of sockets for unicast messages (socket, interface index)
+    /// interface index to unicast socket, so ACKs don't search m_unicastSocketList
+    std::map<uint32_t, Ptr<Socket>> m_interfaceSocket;
     Ptr<Socket> m_multicastRecvSocket; //!< multicast receive socket
 
     std::set<uint32_t> m_interfaceExclusions; //!< Set of excluded interfaces
@@ -214,64 +214,74 @@ void
 OSPFRouting::PrintRoutingTable(Ptr<OutputStreamWrapper> stream, Time::Unit unit) const
 {
     NS_LOG_FUNCTION(this << stream);
-    std::ostream* os = stream->GetStream();
-    // Copy the current ostream state
-    std::ios oldState(nullptr);
-    oldState.copyfmt(*os);
+    // Format the whole table in memory and hand it to the stream in a single write
+    std::ostringstream table;
+    std::ostream* os = &table;
 
     *os << std::resetiosflags(std::ios::adjustfield) << std::setiosflags(std::ios::left);
 
     *os << "Node: " << m_ipv4->GetObject<Node>()->GetId() << ", Time: " << Now().As(unit)
         << ", Local time: " << m_ipv4->GetObject<Node>()->GetLocalTime().As(unit)
-        << ", OSPFRouting table" << std::endl;
+        << ", OSPFRouting table\n";
 
     if (GetNRoutes() > 0)
     {
-        *os << "Destination     Gateway         Genmask         Flags Metric Ref    Use Iface"
-            << std::endl;
-        for (uint32_t j = 0; j < GetNRoutes(); j++)
+        *os << "Destination     Gateway         Genmask         Flags Metric Ref    Use Iface\n";
+        // Walk the route lists in GetRoute() order rather than indexing them, which
+        // rescans the lists and copies every entry
+        std::vector<const DijkstraRIE*> routes;
+        routes.reserve(GetNRoutes());
+        routes.insert(routes.end(), m_hostRoutes.begin(), m_hostRoutes.end());
+        routes.insert(routes.end(), m_networkRoutes.begin(), m_networkRoutes.end());
+        routes.insert(routes.end(), m_ASexternalRoutes.begin(), m_ASexternalRoutes.end());
+        // Resolve each interface name once, many routes share an interface
+        std::vector<std::string> ifaceNames(m_ipv4->GetNInterfaces());
+        for (uint32_t i = 0; i < ifaceNames.size(); i++)
+        {
+            ifaceNames[i] = Names::FindName(m_ipv4->GetNetDevice(i));
+        }
+        for (const DijkstraRIE* entry : routes)
         {
             std::ostringstream dest;
             std::ostringstream gw;
             std::ostringstream mask;
-            std::ostringstream flags;
-            DijkstraRIE route = GetRoute(j);
+            const DijkstraRIE& route = *entry;
             dest << route.GetDest();
             *os << std::setw(16) << dest.str();
             gw << route.GetGateway();
             *os << std::setw(16) << gw.str();
             mask << route.GetDestNetworkMask();
             *os << std::setw(16) << mask.str();
-            flags << "U";
+            const char* flags = "U";
             if (route.IsHost())
             {
-                flags << "H";
+                flags = "UH";
             }
             else if (route.IsGateway())
             {
-                flags << "G";
+                flags = "UG";
             }
-            *os << std::setw(6) << flags.str();
+            *os << std::setw(6) << flags;
             // Metric not implemented
             *os << "-" << "      ";
             // Ref ct not implemented
             *os << "-" << "      ";
             // Use not implemented
             *os << "-" << "   ";
-            if (!Names::FindName(m_ipv4->GetNetDevice(route.GetInterface())).empty())
+            const std::string& ifaceName = ifaceNames[route.GetInterface()];
+            if (!ifaceName.empty())
             {
-                *os << Names::FindName(m_ipv4->GetNetDevice(route.GetInterface()));
+                *os << ifaceName;
             }
             else
             {
                 *os << route.GetInterface();
             }
-            *os << std::endl;
+            *os << '\n';
         }
     }
-    *os << std::endl;
-    // Restore the previous ostream state
-    (*os).copyfmt(oldState);
+    *os << '\n';
+    *stream->GetStream() << table.str();
 }
 
 void
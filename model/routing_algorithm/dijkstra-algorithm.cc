@@ -100,6 +100,7 @@ DijkstraAlgorithm::InitializeRoutes()
     }
 
     NS_LOG_INFO("About to start SPF calculation");
+    uint32_t systemId = Simulator::GetSystemId();
     for (auto i = NodeList::Begin(); i != NodeList::End(); i++)
     {
         Ptr<Node> node = *i;
@@ -108,7 +109,6 @@ DijkstraAlgorithm::InitializeRoutes()
         // participating in routing.
         //
         Ptr<RomamRouter> rtr = node->GetObject<RomamRouter>();
-        uint32_t systemId = Simulator::GetSystemId();
         // Ignore nodes that are not assigned to our systemId (distributed sim)
         if (node->GetSystemId() != systemId)
         {
@@ -352,9 +352,10 @@ DijkstraAlgorithm::SPFNext(Vertex* v, RouteCandidateQueue& candidate)
                 {
                     //
                     // If we've changed the cost to get to the vertex represented by <w>, we
-                    // must reorder the priority queue keyed to that cost.
+                    // must reorder the priority queue keyed to that cost.  Only <cw> has
+                    // moved, so it is enough to put it back in its place.
                     //
-                    candidate.Reorder();
+                    candidate.Reorder(cw);
                 }
             } // new lower cost path found
         } // end W is already on the candidate list
@@ -698,8 +699,8 @@ DijkstraAlgorithm::CheckForStubNode(Ipv4Address root)
                     NS_ASSERT(router);
                     Ptr<RomamRouting> gr = router->GetRoutingProtocol();
                     NS_ASSERT(gr);
-                    gr->AddNetworkRouteTo(Ipv4Address("0.0.0.0"),
-                                          Ipv4Mask("0.0.0.0"),
+                    gr->AddNetworkRouteTo(Ipv4Address::GetZero(),
+                                          Ipv4Mask::GetZero(),
                                           lr->GetLinkData(),
                                           FindOutgoingInterfaceId(transitLink->GetLinkData()));
                     NS_LOG_LOGIC("Inserting default route for node "
@@ -168,6 +168,26 @@ RouteCandidateQueue::Reorder (void)
   NS_LOG_LOGIC (*this);
 }
 
+void
+RouteCandidateQueue::Reorder (Vertex *v)
+{
+  NS_LOG_FUNCTION (this << v);
+
+  DGRCandidateList_t::iterator i = std::find (m_candidates.begin (), m_candidates.end (), v);
+  NS_ASSERT_MSG (i != m_candidates.end (), "Vertex is not in the CandidateQueue");
+  //
+  // The distance of v can only have decreased, so it moves towards the front
+  // and it goes after any vertex in front of it that still ranks before it.
+  //
+  DGRCandidateList_t::iterator pos = std::upper_bound (
+      m_candidates.begin (), i, v,
+      &RouteCandidateQueue::CompareVertex
+      );
+  m_candidates.splice (pos, m_candidates, i);
+  NS_LOG_LOGIC ("After reordering the CandidateQueue");
+  NS_LOG_LOGIC (*this);
+}
+
 /*
  * In this implementation, Vertex follows the ordering where
  * a vertex is ranked first if its GetDistanceFromRoot () is smaller;
@@ -178,22 +198,16 @@ RouteCandidateQueue::Reorder (void)
 bool 
 RouteCandidateQueue::CompareVertex (const Vertex* v1, const Vertex* v2)
 {
-  NS_LOG_FUNCTION (&v1 << &v2);
-
-  bool result = false;
-  if (v1->GetDistanceFromRoot () < v2->GetDistanceFromRoot ())
-    {
-      result = true;
-    }
-  else if (v1->GetDistanceFromRoot () == v2->GetDistanceFromRoot ())
+  // This is called for every comparison made by Push () and Reorder (), so
+  // read each sort key once and do not log here.
+  uint32_t d1 = v1->GetDistanceFromRoot ();
+  uint32_t d2 = v2->GetDistanceFromRoot ();
+  if (d1 != d2)
     {
-      if (v1->GetVertexType () == Vertex::VertexNetwork 
-          && v2->GetVertexType () == Vertex::VertexRouter)
-        {
-          result = true;
-        }
+      return d1 < d2;
     }
-  return result;
+  return v1->GetVertexType () == Vertex::VertexNetwork
+         && v2->GetVertexType () == Vertex::VertexRouter;
 }
 
 } // namespace ns3
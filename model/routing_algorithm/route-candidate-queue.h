@@ -137,6 +137,18 @@ public:
  */
   void Reorder (void);
 
+/**
+ * @brief Moves a single vertex to its place in the Candidate Queue after
+ * its m_distanceFromRoot has been lowered.
+ *
+ * The rest of the queue is still in order, so the vertex is spliced forward
+ * to its new position instead of sorting the whole queue as Reorder () does.
+ *
+ * @see Vertex
+ * @param v The Vertex* pointer whose distance has decreased.
+ */
+  void Reorder (Vertex *v);
+
 private:
 /**
  * Candidate Queue copy construction is disallowed (not implemented) to 
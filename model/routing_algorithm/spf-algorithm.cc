@@ -97,6 +97,30 @@ SPFAlgorithm::InitializeRoutes()
     //     std::chrono::duration_cast<std::chrono::microseconds>(begin.time_since_epoch()).count();
     // NS_LOG_INFO("About to start SPF calculation");
     // NodeList::Iterator listEnd = NodeList::End();
+    //
+    // Index the routing nodes by router ID once.  The route installation below
+    // needs the node of the SPF root for every vertex of every tree, which used
+    // to be a walk of the whole node list each time.  Likewise index the IPv4
+    // stacks by interface address, so the far end of each point-to-point link
+    // is a lookup instead of a scan of every interface of every node.
+    //
+    m_routerNodes.clear();
+    m_addressIpv4.clear();
+    for (auto i = NodeList::Begin(); i != NodeList::End(); i++)
+    {
+        Ptr<RomamRouter> rtr = (*i)->GetObject<RomamRouter>();
+        if (rtr)
+        {
+            m_routerNodes.insert(std::make_pair(rtr->GetRouterId(), *i));
+        }
+        Ptr<Ipv4> nodeIpv4 = (*i)->GetObject<Ipv4>();
+        for (uint32_t iter = 0; iter < nodeIpv4->GetNInterfaces(); iter++)
+        {
+            Ipv4Address addr = nodeIpv4->GetAddress(iter, 0).GetLocal();
+            m_addressIpv4.insert(std::make_pair(addr, nodeIpv4));
+        }
+    }
+    uint32_t systemId = Simulator::GetSystemId();
     for (auto i = NodeList::Begin(); i != NodeList::End(); i++)
     {
         Ptr<Node> node = *i;
@@ -107,12 +131,18 @@ SPFAlgorithm::InitializeRoutes()
         //
         Ptr<RomamRouter> rtr = node->GetObject<RomamRouter>();
 
-        uint32_t systemId = Simulator::GetSystemId();
         // Ignore nodes that are not assigned to our systemId (distributed sim)
         if (node->GetSystemId() != systemId)
         {
             continue;
         }
+        //
+        // The routing protocol and IPv4 stack of this node are the same for every
+        // link examined below, look them up once per node.
+        //
+        Ptr<RomamRouting> routing = rtr->GetRoutingProtocol();
+        NS_ASSERT(routing);
+        Ptr<Ipv4> ipv4 = node->GetObject<Ipv4>();
         // -------- Initialize routing table --------------
         //
         // if the node has a DGR router interface, then run the DGR routing
@@ -170,39 +200,22 @@ SPFAlgorithm::InitializeRoutes()
                     NS_ASSERT(w_lsa);
                     NS_LOG_LOGIC("Found a P2P record from " << v->GetVertexId() << " to "
                                                             << w_lsa->GetLinkStateId());
-                    Ptr<RomamRouter> router = node->GetObject<RomamRouter>();
-                    if (!router)
-                    {
-                        continue;
-                    }
-                    Ptr<RomamRouting> routing = router->GetRoutingProtocol();
-                    NS_ASSERT(routing);
                     LinkRecord* linkRemote = 0;
                     Vertex* w = new Vertex(w_lsa);
                     linkRemote = SPFGetNextLink(w, v, linkRemote);
-                    Ptr<Ipv4> ipv4 = node->GetObject<Ipv4>();
                     int32_t Iface = ipv4->GetInterfaceForAddress(l->GetLinkData());
 
-                    for (auto j = NodeList::Begin(); j != NodeList::End(); j++)
+                    auto remote = m_addressIpv4.find(linkRemote->GetLinkData());
+                    if (remote != m_addressIpv4.end())
                     {
-                        Ptr<Node> nextNode = *j;
-                        Ptr<Ipv4> nextIpv4 = nextNode->GetObject<Ipv4>();
-                        for (uint32_t iter = 0; iter < nextIpv4->GetNInterfaces(); iter++)
+                        Ptr<Ipv4> nextIpv4 = remote->second;
+                        for (uint32_t nIfc = 1; nIfc < nextIpv4->GetNInterfaces(); nIfc++)
                         {
-                            Ipv4InterfaceAddress ifc = nextIpv4->GetAddress(iter, 0);
-                            Ipv4Address addr = ifc.GetLocal();
-                            if (addr == linkRemote->GetLinkData())
-                            {
-                                for (uint32_t nIfc = 1; nIfc < nextIpv4->GetNInterfaces(); nIfc++)
-                                {
-                                    routing->AddHostRouteTo(
-                                        nextIpv4->GetAddress(nIfc, 0).GetLocal(),
-                                        linkRemote->GetLinkData(),
-                                        Iface,
-                                        -1,
-                                        l->GetMetric());
-                                }
-                            }
+                            routing->AddHostRouteTo(nextIpv4->GetAddress(nIfc, 0).GetLocal(),
+                                                    linkRemote->GetLinkData(),
+                                                    Iface,
+                                                    -1,
+                                                    l->GetMetric());
                         }
                     }
                     SPFCalculate(w_lsa->GetLinkStateId(), rtr->GetRouterId(), linkRemote, Iface);
@@ -460,9 +473,10 @@ SPFAlgorithm::SPFNext(Vertex* v, RouteCandidateQueue& candidate)
                 {
                     //
                     // If we've changed the cost to get to the vertex represented by <w>, we
-                    // must reorder the priority queue keyed to that cost.
+                    // must reorder the priority queue keyed to that cost.  Only <cw> has
+                    // moved, so it is enough to put it back in its place.
                     //
-                    candidate.Reorder();
+                    candidate.Reorder(cw);
                 }
             } // new lower cost path found
         } // end W is already on the candidate list
@@ -806,8 +820,8 @@ SPFAlgorithm::CheckForStubNode(Ipv4Address root)
                     NS_ASSERT(router);
                     Ptr<RomamRouting> gr = router->GetRoutingProtocol();
                     NS_ASSERT(gr);
-                    gr->AddNetworkRouteTo(Ipv4Address("0.0.0.0"),
-                                          Ipv4Mask("0.0.0.0"),
+                    gr->AddNetworkRouteTo(Ipv4Address::GetZero(),
+                                          Ipv4Mask::GetZero(),
                                           lr->GetLinkData(),
                                           FindOutgoingInterfaceId(transitLink->GetLinkData()));
                     NS_LOG_LOGIC("Inserting default route for node "
@@ -1313,6 +1327,17 @@ SPFAlgorithm::SPFIntraAddStub(LinkRecord* l, Vertex* v)
     } // for
 }
 
+Ptr<Node>
+SPFAlgorithm::FindRouterNode(Ipv4Address routerId) const
+{
+    auto it = m_routerNodes.find(routerId);
+    if (it == m_routerNodes.end())
+    {
+        return nullptr;
+    }
+    return it->second;
+}
+
 //
 // Return the interface number corresponding to a given IP address and mask
 // This is a wrapper around GetInterfaceForPrefix(), but we first
@@ -1334,52 +1359,37 @@ SPFAlgorithm::FindOutgoingInterfaceId(Ipv4Address a, Ipv4Mask amask)
     //
     Ipv4Address routerId = m_spfroot->GetVertexId();
     //
-    // Walk the list of nodes in the system looking for the one corresponding to
-    // the node at the root of the SPF tree.  This is the node for which we are
-    // building the routing table.
+    // Look up the node corresponding to the node at the root of the SPF tree.
+    // This is the node for which we are building the routing table.
     //
-    for (auto i = NodeList::Begin(); i != NodeList::End(); i++)
+    Ptr<Node> node = FindRouterNode(routerId);
+    if (node)
     {
-        Ptr<Node> node = *i;
-
-        Ptr<RomamRouter> rtr = node->GetObject<RomamRouter>();
         //
-        // If the node doesn't have a RomamRouter interface it can't be the one
-        // we're interested in.
+        // This is the node we're building the routing table for.  We're going to need
+        // the Ipv4 interface to look for the ipv4 interface index.  Since this node
+        // is participating in routing IP version 4 packets, it certainly must have
+        // an Ipv4 interface.
         //
-        if (!rtr)
-        {
-            continue;
-        }
-
-        if (rtr->GetRouterId() == routerId)
-        {
-            //
-            // This is the node we're building the routing table for.  We're going to need
-            // the Ipv4 interface to look for the ipv4 interface index.  Since this node
-            // is participating in routing IP version 4 packets, it certainly must have
-            // an Ipv4 interface.
-            //
-            Ptr<Ipv4> ipv4 = node->GetObject<Ipv4>();
-            NS_ASSERT_MSG(ipv4,
-                          "SPFAlgorithm::FindOutgoingInterfaceId (): "
-                          "GetObject for <Ipv4> interface failed");
-            //
-            // Look through the interfaces on this node for one that has the IP address
-            // we're looking for.  If we find one, return the corresponding interface
-            // index, or -1 if not found.
-            //
-            int32_t interface = ipv4->GetInterfaceForPrefix(a, amask);
+        Ptr<Ipv4> ipv4 = node->GetObject<Ipv4>();
+        NS_ASSERT_MSG(ipv4,
+                      "SPFAlgorithm::FindOutgoingInterfaceId (): "
+                      "GetObject for <Ipv4> interface failed");
+        //
+        // Look through the interfaces on this node for one that has the IP address
+        // we're looking for.  If we find one, return the corresponding interface
+        // index, or -1 if not found.
+        //
+        int32_t interface = ipv4->GetInterfaceForPrefix(a, amask);
 
 #if 0
-          if (interface < 0)
-            {
-              NS_FATAL_ERROR ("SPFAlgorithm::FindOutgoingInterfaceId(): "
-                              "Expected an interface associated with address a:" << a);
-            }
+        if (interface < 0)
+          {
+            NS_FATAL_ERROR ("SPFAlgorithm::FindOutgoingInterfaceId(): "
+                            "Expected an interface associated with address a:" << a);
+          }
 #endif
-            return interface;
-        }
+        return interface;
     }
     //
     // Couldn't find it.
@@ -1427,95 +1437,67 @@ SPFAlgorithm::SPFIntraAddRouter(Vertex* v, Vertex* v_init, Ipv4Address nextHop,
     NS_LOG_LOGIC("Vertex ID = " << routerId);
 
     //
-    // We need to walk the list of nodes looking for the one that has the router
-    // ID corresponding to the root vertex.  This is the one we're going to write
-    // the routing information to.
+    // Look up the node that has the router ID corresponding to the root vertex.
+    // This is the one we're going to write the routing information to.
     //
-    for (auto i = NodeList::Begin(); i != NodeList::End(); i++)
+    Ptr<Node> node = FindRouterNode(routerId_init);
+    if (!node)
+    {
+        NS_LOG_LOGIC("No SPFRouter interface with router ID " << routerId_init);
+        return;
+    }
+    NS_LOG_LOGIC("Setting routes for node " << node->GetId());
+    //
+    // Routing information is updated using the Ipv4 interface.  We need to
+    // GetObject for that interface.  If the node is acting as an IP version 4
+    // router, it should absolutely have an Ipv4 interface.
+    //
+    Ptr<Ipv4> ipv4 = node->GetObject<Ipv4>();
+    NS_ASSERT_MSG(ipv4,
+                  "SPFAlgorithm::SPFIntraAddRouter (): "
+                  "GetObject for <Ipv4> interface failed");
+    //
+    // Get the Global Router Link State Advertisement from the vertex we're
+    // adding the routes to.  The LSA will have a number of attached Global Router
+    // Link Records corresponding to links off of that vertex / node.  We're going
+    // to be interested in the records corresponding to point-to-point links.
+    //
+    LSA* lsa = v->GetLSA();
+    NS_ASSERT_MSG(lsa,
+                  "SPFAlgorithm::SPFIntraAddRouter (): "
+                  "Expected valid LSA in DGRVertex* v");
+
+    Ptr<RomamRouter> router = node->GetObject<RomamRouter>();
+    Ptr<RomamRouting> routing = router->GetRoutingProtocol();
+    NS_ASSERT(routing);
+
+    uint32_t nLinkRecords = lsa->GetNLinkRecords();
+    //
+    // Iterate through the link records on the vertex to which we're going to add
+    // routes.  To make sure we're being clear, we're going to add routing table
+    // entries to the tables on the node corresping to the root of the SPF tree.
+    // These entries will have routes to the IP addresses we find from looking at
+    // the local side of the point-to-point links found on the node described by
+    // the vertex <v>.
+    //
+    NS_LOG_LOGIC(" Node " << node->GetId() << " found " << nLinkRecords
+                          << " link records in LSA " << lsa << "with LinkStateId "
+                          << lsa->GetLinkStateId());
+    for (uint32_t j = 0; j < nLinkRecords; ++j)
     {
-        Ptr<Node> node = *i;
         //
-        // The router ID is accessible through the GlobalRouter interface, so we need
-        // to GetObject for that interface.  If there's no GlobalRouter interface,
-        // the node in question cannot be the router we want, so we continue.
+        // We are only concerned about point-to-point links
         //
-        Ptr<RomamRouter> rtr = node->GetObject<RomamRouter>();
-        if (!rtr)
+        LinkRecord* lr = lsa->GetLinkRecord(j);
+        if (lr->GetLinkType() != LinkRecord::PointToPoint)
         {
-            NS_LOG_LOGIC("No SPFRouter interface on node " << node->GetId());
             continue;
         }
-        // std::cout << "The neighbour node " << node->GetId () << std::endl;
-        //
-        // If the router ID of the current node is equal to the router ID of the
-        // root of the SPF tree, then this node is the one for which we need to
-        // write the routing tables.
-        //
-        NS_LOG_LOGIC("Considering router " << rtr->GetRouterId());
-
-        if (rtr->GetRouterId() == routerId_init)
+        uint32_t distance = v->GetDistanceFromRoot();
+        if (v->GetNRootExitDirections() >= 1)
         {
-            NS_LOG_LOGIC("Setting routes for node " << node->GetId());
-            //
-            // Routing information is updated using the Ipv4 interface.  We need to
-            // GetObject for that interface.  If the node is acting as an IP version 4
-            // router, it should absolutely have an Ipv4 interface.
-            //
-            Ptr<Ipv4> ipv4 = node->GetObject<Ipv4>();
-            NS_ASSERT_MSG(ipv4,
-                          "SPFAlgorithm::SPFIntraAddRouter (): "
-                          "GetObject for <Ipv4> interface failed");
-            //
-            // Get the Global Router Link State Advertisement from the vertex we're
-            // adding the routes to.  The LSA will have a number of attached Global Router
-            // Link Records corresponding to links off of that vertex / node.  We're going
-            // to be interested in the records corresponding to point-to-point links.
-            //
-            LSA* lsa = v->GetLSA();
-            NS_ASSERT_MSG(lsa,
-                          "SPFAlgorithm::SPFIntraAddRouter (): "
-                          "Expected valid LSA in DGRVertex* v");
-
-            uint32_t nLinkRecords = lsa->GetNLinkRecords();
-            //
-            // Iterate through the link records on the vertex to which we're going to add
-            // routes.  To make sure we're being clear, we're going to add routing table
-            // entries to the tables on the node corresping to the root of the SPF tree.
-            // These entries will have routes to the IP addresses we find from looking at
-            // the local side of the point-to-point links found on the node described by
-            // the vertex <v>.
-            //
-            NS_LOG_LOGIC(" Node " << node->GetId() << " found " << nLinkRecords
-                                  << " link records in LSA " << lsa << "with LinkStateId "
-                                  << lsa->GetLinkStateId());
-            for (uint32_t j = 0; j < nLinkRecords; ++j)
-            {
-                //
-                // We are only concerned about point-to-point links
-                //
-                LinkRecord* lr = lsa->GetLinkRecord(j);
-                if (lr->GetLinkType() != LinkRecord::PointToPoint)
-                {
-                    continue;
-                }
-                Ptr<RomamRouter> router = node->GetObject<RomamRouter>();
-                if (!router)
-                {
-                    continue;
-                }
-                Ptr<RomamRouting> routing = router->GetRoutingProtocol();
-                NS_ASSERT(routing);
-                uint32_t distance = v->GetDistanceFromRoot();
-                if (v->GetNRootExitDirections() >= 1)
-                {
-                    int32_t nextIface = v->GetRootExitDirection(0).second;
-                    routing->AddHostRouteTo(lr->GetLinkData(), nextHop, Iface, nextIface, distance);
-                }
-            }
-            //
-            // Done adding the routes for the selected node.
-            //
-            return;
+            int32_t nextIface = v->GetRootExitDirection(0).second;
+            routing->AddHostRouteTo(lr->GetLinkData(), nextHop, Iface, nextIface, distance);
         }
     }
 }
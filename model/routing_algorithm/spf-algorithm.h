@@ -7,6 +7,8 @@
 #include "routing-algorithm.h"
 
 #include "ns3/ipv4-address.h"
+#include "ns3/ipv4.h"
+#include "ns3/node.h"
 #include "ns3/object.h"
 #include "ns3/ptr.h"
 
@@ -53,6 +55,20 @@ class SPFAlgorithm : public RoutingAlgorithm
     Vertex* m_spfroot; //!< the root node
     LSDB* m_lsdb;      //!< the Link State DataBase (LSDB)
 
+    typedef std::map<Ipv4Address, Ptr<Node>> RouterNodeMap_t; //!< router ID to node
+    RouterNodeMap_t m_routerNodes; //!< routing nodes indexed by router ID
+
+    typedef std::map<Ipv4Address, Ptr<Ipv4>> AddressIpv4Map_t; //!< address to IPv4 stack
+    AddressIpv4Map_t m_addressIpv4; //!< IPv4 stacks indexed by interface address
+
+    /**
+     * \brief Find the node of a router in the index built by InitializeRoutes
+     *
+     * \param routerId the router ID
+     * \returns the node, or nullptr if no router has this ID
+     */
+    Ptr<Node> FindRouterNode(Ipv4Address routerId) const;
+
     /**
      * \brief Test if a node is a stub, from an OSPF sense.
      *
@@ -226,7 +242,7 @@ class SPFAlgorithm : public RoutingAlgorithm
      * \param amask the target subnet mask
      * \return the outgoing interface number
      */
-    int32_t FindOutgoingInterfaceId(Ipv4Address a, Ipv4Mask amask = Ipv4Mask("255.255.255.255"));
+    int32_t FindOutgoingInterfaceId(Ipv4Address a, Ipv4Mask amask = Ipv4Mask::GetOnes());
 };
 
 } // namespace ns3
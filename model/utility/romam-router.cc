@@ -282,8 +282,9 @@ RomamRouter::ProcessSingleBroadcastLink(Ptr<NetDevice> nd, LSA* pLSA, NetDeviceC
     {
         NS_LOG_WARN("Warning, interface has multiple IP addresses; using only the primary one");
     }
-    Ipv4Address addrLocal = ipv4Local->GetAddress(interfaceLocal, 0).GetLocal();
-    Ipv4Mask maskLocal = ipv4Local->GetAddress(interfaceLocal, 0).GetMask();
+    Ipv4InterfaceAddress ifaddrLocal = ipv4Local->GetAddress(interfaceLocal, 0);
+    Ipv4Address addrLocal = ifaddrLocal.GetLocal();
+    Ipv4Mask maskLocal = ifaddrLocal.GetMask();
     NS_LOG_LOGIC("Working with local address " << addrLocal);
     uint16_t metricLocal = ipv4Local->GetMetric(interfaceLocal);
 
@@ -341,7 +342,7 @@ RomamRouter::ProcessSingleBroadcastLink(Ptr<NetDevice> nd, LSA* pLSA, NetDeviceC
         // Let's double-check that any designated router we find out on our
         // network is really on our network.
         //
-        if (designatedRtr != "255.255.255.255")
+        if (designatedRtr != Ipv4Address::GetBroadcast())
         {
             Ipv4Address networkHere = addrLocal.CombineMask(maskLocal);
             Ipv4Address networkThere = designatedRtr.CombineMask(maskLocal);
@@ -422,7 +423,7 @@ RomamRouter::ProcessBridgedBroadcastLink(Ptr<NetDevice> nd, LSA* pLSA, NetDevice
   //
 
   bool areTransitNetwork = false;
-  Ipv4Address designatedRtr ("255.255.255.255");
+  Ipv4Address designatedRtr = Ipv4Address::GetBroadcast ();
 
   for (uint32_t i = 0; i < bnd->GetNBridgePorts (); ++i)
     {
@@ -452,7 +453,7 @@ RomamRouter::ProcessBridgedBroadcastLink(Ptr<NetDevice> nd, LSA* pLSA, NetDevice
           // Let's double-check that any designated router we find out on our
           // network is really on our network.
           //
-          if (designatedRtrTemp != "255.255.255.255")
+          if (designatedRtrTemp != Ipv4Address::GetBroadcast ())
             {
               Ipv4Address networkHere = addrLocal.CombineMask (maskLocal);
               Ipv4Address networkThere = designatedRtrTemp.CombineMask (maskLocal);
@@ -623,8 +624,9 @@ RomamRouter::ProcessPointToPointLink(Ptr<NetDevice> ndLocal, LSA* pLSA)
     {
         NS_LOG_WARN("Warning, interface has multiple IP addresses; using only the primary one");
     }
-    Ipv4Address addrRemote = ipv4Remote->GetAddress(interfaceRemote, 0).GetLocal();
-    Ipv4Mask maskRemote = ipv4Remote->GetAddress(interfaceRemote, 0).GetMask();
+    Ipv4InterfaceAddress ifaddrRemote = ipv4Remote->GetAddress(interfaceRemote, 0);
+    Ipv4Address addrRemote = ifaddrRemote.GetLocal();
+    Ipv4Mask maskRemote = ifaddrRemote.GetMask();
     NS_LOG_LOGIC("Working with remote address " << addrRemote);
 
     //
@@ -691,8 +693,9 @@ RomamRouter::BuildNetworkLSAs(NetDeviceContainer c)
         {
             NS_LOG_WARN("Warning, interface has multiple IP addresses; using only the primary one");
         }
-        Ipv4Address addrLocal = ipv4Local->GetAddress(interfaceLocal, 0).GetLocal();
-        Ipv4Mask maskLocal = ipv4Local->GetAddress(interfaceLocal, 0).GetMask();
+        Ipv4InterfaceAddress ifaddrLocal = ipv4Local->GetAddress(interfaceLocal, 0);
+        Ipv4Address addrLocal = ifaddrLocal.GetLocal();
+        Ipv4Mask maskLocal = ifaddrLocal.GetMask();
 
         auto pLSA = new LSA;
         NS_ABORT_MSG_IF(pLSA == nullptr,
@@ -838,7 +841,7 @@ RomamRouter::FindDesignatedRouterForLink(Ptr<NetDevice> ndLocal) const
     NS_LOG_LOGIC("Looking for designated router off of net device " << ndLocal << " on node "
                                                                     << ndLocal->GetNode()->GetId());
 
-    Ipv4Address designatedRtr("255.255.255.255");
+    Ipv4Address designatedRtr = Ipv4Address::GetBroadcast();
 
     //
     // Look through all of the devices on the channel to which the net device
@@ -1102,23 +1105,16 @@ RomamRouter::GetLSA(uint32_t n, LSA& lsa) const
     NS_ASSERT_MSG(lsa.IsEmpty(), "RomamRouter::GetLSA (): Must pass empty LSA");
     //
     // All of the work was done in GetNumLSAs.  All we have to do here is to
-    // walk the list of link state advertisements created there and return the
-    // one the client is interested in.
+    // return the link state advertisement created there that the client is
+    // interested in.  The advertisements are stored in a vector, so callers
+    // walking them by index do not rescan from the first one each time.
     //
-    auto i = m_LSAs.begin();
-    uint32_t j = 0;
-
-    for (; i != m_LSAs.end(); i++, j++)
+    if (n >= m_LSAs.size())
     {
-        if (j == n)
-        {
-            LSA* p = *i;
-            lsa = *p;
-            return true;
-        }
+        return false;
     }
-
-    return false;
+    lsa = *m_LSAs[n];
+    return true;
 }
 
 void
@@ -13,6 +13,7 @@
 
 #include <list>
 #include <stdint.h>
+#include <vector>
 
 namespace ns3
 {
@@ -280,8 +281,8 @@ class RomamRouter : public Object
      */
     Ptr<BridgeNetDevice> NetDeviceIsBridged(Ptr<NetDevice> nd) const;
 
-    typedef std::list<LSA*> ListOfLSAs_t; //!< container for the GlobalRoutingLSAs
-    ListOfLSAs_t m_LSAs;                  //!< database of GlobalRoutingLSAs
+    typedef std::vector<LSA*> ListOfLSAs_t; //!< container for the GlobalRoutingLSAs
+    ListOfLSAs_t m_LSAs;                    //!< database of GlobalRoutingLSAs
 
     Ipv4Address m_routerId; //!< router ID (its IPv4 address)
     // Ptr<Ipv4GlobalRouting> m_routingProtocol; //!< the Ipv4GlobalRouting in use